@@ -20,29 +20,62 @@ def create_app(config_name='default'):
     if not app.config.get('SECRET_KEY'):
         app.config['SECRET_KEY'] = 'dev-secret-key-change-in-production'
     
+    # Per-host site content and page caches
+    from app.utils.sites import init_sites
+    init_sites(app)
+    
+    # Jinja fragment caching
+    from app.utils.fragment_cache import init_fragment_cache
+    init_fragment_cache(app)
+    
     # Register blueprints
-    from app.routes import main, business, developer, projects, contact
+    from app.routes import main, business, developer, projects, contact, api, admin, discovery
     app.register_blueprint(main.bp)
     app.register_blueprint(business.bp)
     app.register_blueprint(developer.bp)
     app.register_blueprint(projects.bp)
     app.register_blueprint(contact.bp)
+    app.register_blueprint(api.bp)
+    app.register_blueprint(admin.bp)
+    app.register_blueprint(discovery.bp)
     
     # Register error handlers
     register_error_handlers(app)
     
+    # In-memory page-view counters with batched SQLite flushes
+    from app.utils.analytics import init_analytics
+    init_analytics(app)
+    
+    # Background-built resume PDF/HTML exports
+    from app.utils.resume_export import init_resume_export
+    init_resume_export(app)
+    
+    # Serve /static ahead of blueprint dispatch
+    from app.utils.static_files import init_static_files
+    init_static_files(app)
+    
     return app
 
 
 def register_error_handlers(app):
-    """Register error handlers"""
+    """Register error handlers (branded pages rendered once, served from memory)"""
+    from app.routes.api import error_response, is_api_request
+    from app.utils.error_pages import init_error_pages
+    error_pages = init_error_pages(app)
     
     @app.errorhandler(404)
     def not_found(error):
-        """Handle 404 errors"""
-        return "Page not found", 404
+        """Handle 404 errors (JSON for the API)"""
+        if is_api_request():
+            return error_response(404, 'Not found')
+        return error_pages.missing(404)
+    
+    @app.errorhandler(410)
+    def gone(error):
+        """Handle 410 errors"""
+        return error_pages.missing(410)
     
     @app.errorhandler(500)
     def internal_error(error):
         """Handle 500 errors"""
-        return "Internal server error", 500
+        return error_pages.response(500)
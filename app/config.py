@@ -15,17 +15,75 @@ class Config:
     
     # Content directory
     CONTENT_DIR = os.path.join(os.path.dirname(BASE_DIR), 'content')
+    
+    # Multi-site hosting (sites.json maps hosts to content snapshots)
+    SITES_FILE = os.environ.get('SITES_FILE')
+    SITE_PAGE_CACHE_ENABLED = True
+    SITE_CACHE_QUOTA_BYTES = 2 * 1024 * 1024
+    SITE_CACHE_TOTAL_BYTES = 32 * 1024 * 1024
+    SITE_CONTENT_POLL_INTERVAL = 10
+    
+    # Admin endpoints are disabled unless a token is set
+    ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+    
+    # Page-view analytics (SQLite path defaults to the instance folder)
+    ANALYTICS_ENABLED = True
+    ANALYTICS_DB_PATH = os.environ.get('ANALYTICS_DB_PATH')
+    ANALYTICS_FLUSH_INTERVAL = 30
+    ANALYTICS_MAX_REFERRERS = 100
+    
+    # Resume exports (directory defaults to the instance folder)
+    RESUME_EXPORT_DIR = os.environ.get('RESUME_EXPORT_DIR')
+    RESUME_EXPORT_BACKGROUND = True
+    RESUME_EXPORT_STALE_GRACE = 600
+    RESUME_EXPORT_MAX_AGE = 365 * 24 * 3600
+    
+    # Error pages (dead URLs skip Flask after this many misses)
+    ERROR_PAGE_CACHE_BYTES = 512 * 1024
+    ERROR_PAGE_MAX_TRACKED_PATHS = 10000
+    ERROR_PAGE_FAST_PATH_THRESHOLD = 3
+    ERROR_PAGE_MAX_AGE = 300
+    
+    # JSON API
+    API_CACHE_MAX_AGE = 60
+    API_GZIP_MIN_BYTES = 512
+    API_CACHE_MAX_BYTES = 2 * 1024 * 1024
+    
+    # sitemap.xml, robots.txt and Atom feed
+    DISCOVERY_CACHE_MAX_AGE = 3600
+    DISCOVERY_CACHE_MAX_BYTES = 512 * 1024
+    
+    # Jinja fragment cache ({% cache %} blocks)
+    FRAGMENT_CACHE_ENABLED = True
+    FRAGMENT_CACHE_MAX_BYTES = 4 * 1024 * 1024
+    FRAGMENT_CACHE_DEFAULT_TIMEOUT = None
+    
+    # Static file middleware
+    STATIC_MIDDLEWARE_ENABLED = True
+    STATIC_CACHE_MAX_AGE = 3600
+    STATIC_HOT_FILE_MAX_BYTES = 256 * 1024
+    STATIC_HOT_CACHE_BYTES = 8 * 1024 * 1024
+    # Set to an internal proxy location (e.g. '/_static/') to offload large files
+    STATIC_ACCEL_REDIRECT_PREFIX = os.environ.get('STATIC_ACCEL_REDIRECT_PREFIX')
+    STATIC_ACCEL_REDIRECT_HEADER = 'X-Accel-Redirect'
 
 
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
+    # Always re-render so template edits show up immediately
+    FRAGMENT_CACHE_ENABLED = False
+    SITE_PAGE_CACHE_ENABLED = False
 
 
 class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     WTF_CSRF_ENABLED = False
+    # Tests flush analytics, build exports and check content explicitly
+    ANALYTICS_FLUSH_INTERVAL = 0
+    RESUME_EXPORT_BACKGROUND = False
+    SITE_CONTENT_POLL_INTERVAL = 0
 
 
 class ProductionConfig(Config):
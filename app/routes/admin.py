@@ -0,0 +1,41 @@
+"""Admin routes (token protected)"""
+import hmac
+
+from flask import Blueprint, abort, current_app, jsonify, request
+
+bp = Blueprint('admin', __name__, url_prefix='/admin')
+
+
+@bp.before_request
+def require_token():
+    """
+    Allow access only with the configured admin token
+
+    The whole section answers 404 when no token is configured.
+    """
+    expected = current_app.config.get('ADMIN_TOKEN')
+    if not expected:
+        abort(404)
+    header = request.headers.get('Authorization', '')
+    supplied = header[7:] if header.startswith('Bearer ') else ''
+    if not hmac.compare_digest(supplied.encode(), expected.encode()):
+        abort(401)
+
+
+@bp.route('/analytics')
+def analytics():
+    """
+    Page-view report built from the flushed daily rollups
+
+    Query args:
+        days: Number of most recent days to include (default 30)
+        site: Restrict the report to one site
+
+    Returns:
+        JSON report
+    """
+    tracker = current_app.extensions.get('analytics')
+    if tracker is None:
+        abort(404)
+    days = max(1, min(request.args.get('days', 30, type=int), 366))
+    return jsonify(tracker.report(days=days, site=request.args.get('site')))
@@ -0,0 +1,219 @@
+"""Versioned JSON API (read-only) for portfolio content"""
+import gzip
+import hashlib
+
+from flask import Blueprint, current_app, request, url_for
+
+from app.utils.cache import LRUByteCache
+from app.utils.serialization import dumps
+from app.utils.sites import current_site
+
+bp = Blueprint('api', __name__, url_prefix='/api/v1')
+
+
+@bp.record_once
+def init_payload_cache(state):
+    """Give API payloads their own cache, separate from rendered pages"""
+    state.app.extensions['api_cache'] = LRUByteCache(
+        state.app.config.get('API_CACHE_MAX_BYTES', 2 * 1024 * 1024)
+    )
+
+
+@bp.route('/')
+def index():
+    """
+    API root listing the available resources
+
+    Returns:
+        JSON response with resource URLs
+    """
+    return _payload_response(('index',), lambda site: {
+        name: url_for(f'api.{name}') for name in ('skills', 'experience', 'technologies', 'projects')
+    })
+
+
+@bp.route('/skills')
+def skills():
+    """
+    Business and developer skills
+
+    Returns:
+        JSON response grouped by section
+    """
+    return _payload_response(('skills',), lambda site: {
+        'business': site.content['business']['skills'],
+        'developer': site.content['developer']['skills']
+    })
+
+
+@bp.route('/experience')
+def experience():
+    """
+    Professional experience
+
+    Returns:
+        JSON response with experience entries
+    """
+    return _payload_response(('experience',), lambda site: site.content['business']['experience'])
+
+
+@bp.route('/technologies')
+def technologies():
+    """
+    Technologies grouped by category
+
+    Returns:
+        JSON response with technology lists
+    """
+    return _payload_response(('technologies',), lambda site: site.content['developer']['technologies'])
+
+
+@bp.route('/projects')
+def projects():
+    """
+    All projects
+
+    Returns:
+        JSON response with project entries
+    """
+    return _payload_response(('projects',), lambda site: site.projects)
+
+
+@bp.route('/projects/<project_id>')
+def project(project_id):
+    """
+    Single project
+
+    Args:
+        project_id: Project identifier
+
+    Returns:
+        JSON response with the project, or a 404 error
+    """
+    return _payload_response(('project', project_id), lambda site: site.get_project(project_id))
+
+
+def _payload_response(resource_key, build):
+    """
+    Serve a resource from precomputed bytes
+
+    Payloads are serialized and gzipped once per content version and field
+    selection, then kept in the bounded API cache. Requested fields are
+    intersected with the resource's own fields first, so unknown names
+    never create new entries.
+
+    Args:
+        resource_key: Tuple identifying the resource
+        build: Callable returning the resource data for a site (None = 404)
+
+    Returns:
+        JSON response (200, 304 or 404)
+    """
+    site = current_site()
+    data = build(site)
+    if data is None:
+        return error_response(404, 'Not found')
+    fields = tuple(sorted(set(_requested_fields()) & _field_names(data)))
+    key = (site.id, site.content_version, fields) + resource_key
+
+    cache = current_app.extensions['api_cache']
+    payload = cache.get(key)
+    if payload is None:
+        if fields:
+            data = _select_fields(data, set(fields))
+        payload = _build_payload(data, site.content_version)
+        cache.set(key, payload)
+
+    body, compressed, etag = payload
+    use_gzip = bool(compressed) and request.accept_encodings['gzip'] > 0
+    response = current_app.response_class(
+        compressed if use_gzip else body, mimetype='application/json'
+    )
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+        etag += '-gz'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config.get('API_CACHE_MAX_AGE', 60)
+    return response.make_conditional(request)
+
+
+def _build_payload(data, version):
+    """
+    Serialize a payload and precompute its gzip variant and ETag
+
+    Returns:
+        Tuple of (body, gzipped body or b'', etag)
+    """
+    body = dumps({'version': version, 'data': data})
+    compressed = b''
+    if len(body) >= current_app.config.get('API_GZIP_MIN_BYTES', 512):
+        compressed = gzip.compress(body, mtime=0)
+    return body, compressed, hashlib.sha1(body).hexdigest()
+
+
+def _requested_fields():
+    """
+    Parse the ``?fields=`` query argument
+
+    Returns:
+        Sorted tuple of field names (empty when not given)
+    """
+    raw = request.args.get('fields', '')
+    return tuple(sorted({name.strip() for name in raw.split(',') if name.strip()}))
+
+
+def _field_names(data):
+    """
+    Field names that ``?fields=`` can select from a resource
+
+    Args:
+        data: Resource data
+
+    Returns:
+        Set of record keys (empty for plain values)
+    """
+    if isinstance(data, list):
+        return set().union(*(_field_names(item) for item in data))
+    if isinstance(data, dict):
+        if data and all(isinstance(value, list) for value in data.values()):
+            return set().union(*(_field_names(value) for value in data.values()))
+        return set(data)
+    return set()
+
+
+def _select_fields(data, fields):
+    """
+    Keep only the requested fields of each record
+
+    Lists and groups of lists (e.g. skills by section) are filtered
+    item by item; plain values are returned unchanged.
+
+    Args:
+        data: Resource data
+        fields: Set of field names to keep
+
+    Returns:
+        Filtered data
+    """
+    if isinstance(data, list):
+        return [_select_fields(item, fields) for item in data]
+    if isinstance(data, dict):
+        if data and all(isinstance(value, list) for value in data.values()):
+            return {key: _select_fields(value, fields) for key, value in data.items()}
+        return {key: value for key, value in data.items() if key in fields}
+    return data
+
+
+def is_api_request():
+    """Whether the current request targets the API, including unrouted paths"""
+    return request.blueprint == bp.name or request.path.startswith(bp.url_prefix + '/')
+
+
+def error_response(status, message):
+    """Build a JSON error response"""
+    return current_app.response_class(
+        dumps({'error': message}), status=status, mimetype='application/json'
+    )
@@ -1,10 +1,14 @@
 """Business section routes"""
-from flask import Blueprint, render_template
+from flask import Blueprint, abort, current_app, redirect, send_file, url_for
+
+from app.utils.resume_export import EXPORT_FORMATS, build_resume
+from app.utils.sites import current_site, render_site_template, site_cached
 
 bp = Blueprint('business', __name__, url_prefix='/business')
 
 
 @bp.route('/')
+@site_cached()
 def index():
     """
     Business section landing page
@@ -12,40 +16,19 @@ def index():
     Returns:
         Rendered template for business section
     """
-    # Sample business data - will be replaced with JSON data later
-    skills = [
-        {'name': 'Business Analysis', 'level': 90},
-        {'name': 'Project Management', 'level': 85},
-        {'name': 'Strategic Planning', 'level': 88},
-        {'name': 'Data Analysis', 'level': 85},
-        {'name': 'Process Optimization', 'level': 80},
-        {'name': 'Stakeholder Management', 'level': 87}
-    ]
-    
-    experience = [
-        {
-            'title': 'Business Analyst Intern',
-            'company': 'Tech Solutions Inc.',
-            'period': '2023 - 2024',
-            'description': 'Analyzed business processes and developed optimization strategies'
-        },
-        {
-            'title': 'Project Coordinator',
-            'company': 'Innovation Labs',
-            'period': '2022 - 2023',
-            'description': 'Coordinated cross-functional teams and managed project timelines'
-        }
-    ]
-    
-    return render_template(
+    site = current_site()
+    business = site.content['business']
+    
+    return render_site_template(
         'pages/business.html',
-        title='Business Professional | Joshua Nizamudin',
-        skills=skills,
-        experience=experience
+        title=f'Business Professional | {site.name}',
+        skills=business['skills'],
+        experience=business['experience']
     )
 
 
 @bp.route('/resume')
+@site_cached()
 def resume():
     """
     Resume/CV page
@@ -53,7 +36,69 @@ def resume():
     Returns:
         Rendered template for resume
     """
-    return render_template(
+    site = current_site()
+    # Queue the PDF/HTML exports in the background so downloads are ready
+    current_app.extensions['resume_export'].get(site, 'pdf')
+    return render_site_template(
         'pages/resume.html',
-        title='Resume | Joshua Nizamudin'
+        title=f'Resume | {site.name}',
+        resume=build_resume(site)
     )
+
+
+@bp.route('/resume.<export_format>')
+def resume_export(export_format):
+    """
+    Stable download link for the resume exports
+    
+    Args:
+        export_format: 'pdf' or 'html'
+    
+    Returns:
+        Redirect to the content-hashed artifact, or 503 while it is built
+    """
+    if export_format not in EXPORT_FORMATS:
+        abort(404)
+    artifact = current_app.extensions['resume_export'].get(current_site(), export_format)
+    if artifact is None:
+        response = current_app.response_class(
+            'Resume export is being generated, please try again shortly.',
+            status=503, mimetype='text/plain'
+        )
+        response.headers['Retry-After'] = '5'
+        return response
+    response = redirect(url_for('business.resume_file', filename=artifact.filename))
+    response.cache_control.no_cache = True
+    return response
+
+
+@bp.route('/resume/files/<filename>')
+def resume_file(filename):
+    """
+    Serve a generated resume artifact
+    
+    Artifacts are immutable (their name is a content hash), so they are
+    served with long-lived caching, ETags and range support.
+    
+    Args:
+        filename: Content-hashed artifact name
+    
+    Returns:
+        File response
+    """
+    artifact = current_app.extensions['resume_export'].find(current_site(), filename)
+    if artifact is None:
+        abort(404)
+    try:
+        response = send_file(
+            artifact.path,
+            mimetype=artifact.mimetype,
+            conditional=True,
+            etag=artifact.etag,
+            max_age=current_app.config.get('RESUME_EXPORT_MAX_AGE', 31536000)
+        )
+    except FileNotFoundError:
+        abort(404)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
@@ -1,5 +1,7 @@
 """Contact page routes"""
-from flask import Blueprint, render_template, request, flash, redirect, url_for
+from flask import Blueprint, request, flash, redirect, url_for
+
+from app.utils.sites import current_site, render_site_template
 
 bp = Blueprint('contact', __name__, url_prefix='/contact')
 
@@ -31,9 +33,9 @@ def index():
         if errors:
             for error in errors:
                 flash(error, 'error')
-            return render_template(
+            return render_site_template(
                 'pages/contact.html',
-                title='Contact | Joshua Nizamudin',
+                title=f'Contact | {current_site().name}',
                 name=name,
                 email=email,
                 subject=subject,
@@ -46,7 +48,7 @@ def index():
         return redirect(url_for('contact.index'))
     
     # GET request - show form
-    return render_template(
+    return render_site_template(
         'pages/contact.html',
-        title='Contact | Joshua Nizamudin'
+        title=f'Contact | {current_site().name}'
     )
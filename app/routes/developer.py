@@ -1,10 +1,13 @@
 """Developer section routes"""
-from flask import Blueprint, render_template
+from flask import Blueprint
+
+from app.utils.sites import current_site, render_site_template, site_cached
 
 bp = Blueprint('developer', __name__, url_prefix='/developer')
 
 
 @bp.route('/')
+@site_cached()
 def index():
     """
     Developer section landing page
@@ -12,34 +15,19 @@ def index():
     Returns:
         Rendered template for developer section
     """
-    # Sample developer data - will be replaced with JSON data later
-    skills = [
-        {'name': 'Python', 'level': 90, 'category': 'Backend'},
-        {'name': 'Flask/Django', 'level': 85, 'category': 'Backend'},
-        {'name': 'JavaScript', 'level': 80, 'category': 'Frontend'},
-        {'name': 'HTML/CSS', 'level': 88, 'category': 'Frontend'},
-        {'name': 'SQL/PostgreSQL', 'level': 82, 'category': 'Database'},
-        {'name': 'Git/GitHub', 'level': 87, 'category': 'Tools'},
-        {'name': 'REST APIs', 'level': 85, 'category': 'Backend'},
-        {'name': 'Testing (pytest)', 'level': 88, 'category': 'Quality'}
-    ]
-    
-    technologies = {
-        'Languages': ['Python', 'JavaScript', 'HTML/CSS', 'SQL'],
-        'Frameworks': ['Flask', 'Django', 'Tailwind CSS', 'Alpine.js'],
-        'Tools': ['Git', 'VS Code', 'Docker', 'Pytest'],
-        'Databases': ['PostgreSQL', 'SQLite', 'MongoDB']
-    }
+    site = current_site()
+    developer = site.content['developer']
     
-    return render_template(
+    return render_site_template(
         'pages/developer.html',
-        title='Web Developer | Joshua Nizamudin',
-        skills=skills,
-        technologies=technologies
+        title=f'Web Developer | {site.name}',
+        skills=developer['skills'],
+        technologies=developer['technologies']
     )
 
 
 @bp.route('/github')
+@site_cached()
 def github():
     """
     GitHub profile and contributions
@@ -47,7 +35,7 @@ def github():
     Returns:
         Rendered template for GitHub showcase
     """
-    return render_template(
+    return render_site_template(
         'pages/github.html',
-        title='GitHub Profile | Joshua Nizamudin'
+        title=f'GitHub Profile | {current_site().name}'
     )
@@ -0,0 +1,107 @@
+"""Crawler discovery documents: sitemap.xml, robots.txt and the projects feed"""
+import gzip
+import hashlib
+
+from flask import Blueprint, current_app, render_template, request, url_for
+
+from app.utils.cache import LRUByteCache
+from app.utils.site_urls import disallowed_prefixes, site_urls
+from app.utils.sites import current_site
+
+bp = Blueprint('discovery', __name__)
+
+
+@bp.record_once
+def init_document_cache(state):
+    """Keep discovery documents in their own cache, apart from rendered pages"""
+    state.app.extensions['discovery_cache'] = LRUByteCache(
+        state.app.config.get('DISCOVERY_CACHE_MAX_BYTES', 512 * 1024)
+    )
+
+
+@bp.route('/sitemap.xml')
+def sitemap():
+    """
+    Sitemap listing every public page, including each project
+
+    Returns:
+        XML response (200 or 304)
+    """
+    return _document_response('sitemap', 'application/xml', lambda site: render_template(
+        'discovery/sitemap.xml',
+        urls=site_urls(current_app, site),
+        base_url=site.canonical_url,
+        lastmod=site.content_modified.date().isoformat()
+    ))
+
+
+@bp.route('/robots.txt')
+def robots():
+    """
+    Crawler rules pointing at the sitemap
+
+    Returns:
+        Plain text response (200 or 304)
+    """
+    def build(site):
+        lines = ['User-agent: *']
+        lines += [f'Disallow: {prefix}' for prefix in disallowed_prefixes(current_app)]
+        lines += ['', f"Sitemap: {site.canonical_url}{url_for('discovery.sitemap')}", '']
+        return '\n'.join(lines)
+
+    return _document_response('robots', 'text/plain', build)
+
+
+@bp.route('/feed.xml')
+def feed():
+    """
+    Atom feed of projects
+
+    Returns:
+        Atom response (200 or 304)
+    """
+    return _document_response('feed', 'application/atom+xml', lambda site: render_template(
+        'discovery/feed.xml',
+        urls=[url for url in site_urls(current_app, site) if url.endpoint == 'projects.detail'],
+        base_url=site.canonical_url,
+        updated=site.content_modified.isoformat().replace('+00:00', 'Z')
+    ))
+
+
+def _document_response(name, mimetype, build):
+    """
+    Serve a discovery document from precomputed bytes
+
+    Documents are built once per content version, with absolute URLs on
+    the site's canonical URL (never the request Host), then kept with a
+    gzip variant in the dedicated discovery cache.
+
+    Args:
+        name: Document name
+        mimetype: Response MIME type
+        build: Callable taking the site and returning the text
+
+    Returns:
+        Response (200 or 304)
+    """
+    site = current_site()
+    key = (site.id, name, site.content_version)
+
+    cache = current_app.extensions['discovery_cache']
+    document = cache.get(key)
+    if document is None:
+        body = build(site).encode('utf-8')
+        document = (body, gzip.compress(body, mtime=0), hashlib.sha1(body).hexdigest())
+        cache.set(key, document)
+
+    body, compressed, etag = document
+    use_gzip = request.accept_encodings['gzip'] > 0 and len(compressed) < len(body)
+    response = current_app.response_class(compressed if use_gzip else body, mimetype=mimetype)
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+        etag += '-gz'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config.get('DISCOVERY_CACHE_MAX_AGE', 3600)
+    return response.make_conditional(request)
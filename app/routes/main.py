@@ -1,10 +1,13 @@
 """Main routes (landing page)"""
-from flask import Blueprint, render_template
+from flask import Blueprint
+
+from app.utils.sites import current_site, render_site_template, site_cached
 
 bp = Blueprint('main', __name__)
 
 
 @bp.route('/')
+@site_cached()
 def index():
     """
     Landing page route
@@ -12,9 +15,9 @@ def index():
     Returns:
         Rendered template for landing page
     """
-    return render_template(
+    return render_site_template(
         'pages/index.html',
-        title='Joshua Nizamudin | Portfolio'
+        title=f'{current_site().name} | Portfolio'
     )
 
 
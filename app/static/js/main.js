@@ -16,4 +16,40 @@ document.addEventListener('DOMContentLoaded', function() {
             }
         });
     });
+    
+    // Project filters: swap only the project grid instead of reloading the page
+    const projectGrid = document.getElementById('project-grid');
+    if (projectGrid && window.fetch) {
+        const loadGrid = function(url) {
+            return fetch(url, { headers: { 'HX-Request': 'true' } })
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error('Failed to load projects');
+                    }
+                    return response.text();
+                })
+                .then(html => {
+                    projectGrid.innerHTML = html;
+                });
+        };
+        
+        document.querySelectorAll('a[data-grid-filter]').forEach(link => {
+            link.addEventListener('click', function (e) {
+                e.preventDefault();
+                const url = this.href;
+                loadGrid(url)
+                    .then(() => history.pushState({ projectGrid: true }, '', url))
+                    .catch(() => { window.location.href = url; });
+            });
+        });
+        
+        window.addEventListener('popstate', function () {
+            // Keep the highlighted filter button in step with the grid
+            const category = new URLSearchParams(window.location.search).get('category');
+            window.dispatchEvent(new CustomEvent('grid-filter', {
+                detail: (category || 'all').toLowerCase()
+            }));
+            loadGrid(window.location.href).catch(() => window.location.reload());
+        });
+    }
 });
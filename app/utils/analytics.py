@@ -0,0 +1,262 @@
+"""Privacy-friendly page-view analytics
+
+Views are counted in memory per (day, site, endpoint, project, referrer
+host) and periodically flushed to SQLite as batched upserts. No IP
+addresses, cookies or user agents are recorded.
+"""
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+from collections import Counter
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+from flask import request
+
+from app.utils.partials import is_partial_request
+from app.utils.sites import current_site
+
+logger = logging.getLogger(__name__)
+
+# Referrer bucket for hosts beyond the per-interval limit
+OTHER_REFERRER = 'other'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_views (
+    day TEXT NOT NULL,
+    site TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    project_id TEXT NOT NULL DEFAULT '',
+    referrer_host TEXT NOT NULL DEFAULT '',
+    views INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, site, endpoint, project_id, referrer_host)
+)
+"""
+
+UPSERT = """
+INSERT INTO page_views (day, site, endpoint, project_id, referrer_host, views)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (day, site, endpoint, project_id, referrer_host)
+DO UPDATE SET views = views + excluded.views
+"""
+
+
+class PageViewAnalytics:
+    """
+    In-memory page-view counters with a background SQLite flusher
+
+    ``record`` only touches a dictionary under a lock; all I/O happens in
+    ``flush``, which runs on a daemon thread every ``flush_interval``
+    seconds (or manually when the interval is 0).
+
+    Referrer hosts come from a client-controlled header, so at most
+    ``max_referrers`` distinct hosts are kept per flush interval; views
+    from further hosts are counted under ``'other'``.
+    """
+
+    def __init__(self, db_path, flush_interval=30, max_referrers=100):
+        """
+        Args:
+            db_path: Path to the SQLite database
+            flush_interval: Seconds between background flushes (0 = manual)
+            max_referrers: Distinct referrer hosts kept per flush interval
+        """
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.max_referrers = max_referrers
+        self._counts = Counter()
+        self._referrers = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._worker_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._schema_ready = False
+
+    def record(self, site, endpoint, project_id=None, referrer=None, day=None):
+        """
+        Count one page view
+
+        Args:
+            site: Site identifier
+            endpoint: Flask endpoint name
+            project_id: Project identifier for project pages
+            referrer: Host of an external referrer
+            day: Day bucket (defaults to today, UTC)
+        """
+        day = day or datetime.now(timezone.utc).date()
+        with self._lock:
+            if referrer and referrer not in self._referrers:
+                if len(self._referrers) < self.max_referrers:
+                    self._referrers.add(referrer)
+                else:
+                    referrer = OTHER_REFERRER
+            key = (day.isoformat(), site, endpoint, project_id or '', referrer or '')
+            self._counts[key] += 1
+        self._ensure_worker()
+
+    def pending(self):
+        """Number of distinct counters waiting to be flushed"""
+        with self._lock:
+            return len(self._counts)
+
+    def flush(self):
+        """
+        Write pending counters to SQLite in one transaction
+
+        Returns:
+            Number of rows upserted
+        """
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            self._referrers = set()
+        if not counts:
+            return 0
+        rows = [key + (views,) for key, views in counts.items()]
+        try:
+            with self._flush_lock, closing(self._connect()) as conn, conn:
+                conn.executemany(UPSERT, rows)
+        except sqlite3.Error:
+            # Keep the deltas for the next attempt
+            with self._lock:
+                self._counts.update(counts)
+            raise
+        return len(rows)
+
+    def report(self, days=30, site=None):
+        """
+        Summarize flushed page views
+
+        Args:
+            days: Number of most recent days to include
+            site: Restrict to one site identifier
+
+        Returns:
+            Dictionary of totals by endpoint, project, referrer and day
+        """
+        since = (datetime.now(timezone.utc).date() - timedelta(days=days - 1)).isoformat()
+        where = 'WHERE day >= ?'
+        params = [since]
+        if site:
+            where += ' AND site = ?'
+            params.append(site)
+
+        def totals(column, extra=''):
+            query = (f'SELECT {column}, SUM(views) FROM page_views {where}{extra} '
+                     f'GROUP BY {column} ORDER BY SUM(views) DESC, {column}')
+            return [{column: name, 'views': views}
+                    for name, views in conn.execute(query, params)]
+
+        with closing(self._connect()) as conn:
+            total = conn.execute(f'SELECT COALESCE(SUM(views), 0) FROM page_views {where}',
+                                 params).fetchone()[0]
+            return {
+                'since': since,
+                'total': total,
+                'endpoints': totals('endpoint'),
+                'projects': totals('project_id', " AND project_id != ''"),
+                'referrers': totals('referrer_host', " AND referrer_host != ''"),
+                'days': sorted(totals('day'), key=lambda row: row['day'])
+            }
+
+    def stop(self):
+        """Stop the background thread and flush what is left"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        try:
+            self.flush()
+        except sqlite3.Error:
+            logger.exception('Could not flush page views to %s', self.db_path)
+
+    def _connect(self):
+        """Open a connection, creating the schema on first use"""
+        if not self._schema_ready:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        if not self._schema_ready:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(SCHEMA)
+            conn.commit()
+            self._schema_ready = True
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def _ensure_worker(self):
+        """Start the flush thread once per process (workers may be forked)"""
+        if not self.flush_interval or self._pid == os.getpid():
+            return
+        with self._worker_lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, name='analytics-flush',
+                                            daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def _run(self):
+        """Flush periodically until stopped"""
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error:
+                logger.exception('Could not flush page views to %s', self.db_path)
+
+
+def referrer_host(referrer, own_host):
+    """
+    Reduce a referrer URL to its host, dropping internal navigation
+
+    Args:
+        referrer: Referer header value
+        own_host: Host serving the request
+
+    Returns:
+        External referrer host, or None
+    """
+    if not referrer:
+        return None
+    host = urlsplit(referrer).hostname
+    if not host or host == own_host.split(':', 1)[0].lower():
+        return None
+    return host
+
+
+def init_analytics(app):
+    """
+    Count successful page views after each request
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get('ANALYTICS_ENABLED', True):
+        return
+    analytics = PageViewAnalytics(
+        app.config.get('ANALYTICS_DB_PATH') or os.path.join(app.instance_path, 'analytics.sqlite3'),
+        app.config.get('ANALYTICS_FLUSH_INTERVAL', 30),
+        app.config.get('ANALYTICS_MAX_REFERRERS', 100)
+    )
+    app.extensions['analytics'] = analytics
+
+    @app.after_request
+    def record_page_view(response):
+        endpoint = request.endpoint
+        # Partial grid swaps are filter clicks on a page already counted
+        if (request.method == 'GET' and response.status_code == 200 and endpoint
+                and not endpoint.startswith(('admin.', 'api.', 'discovery.', 'static'))
+                and not is_partial_request()):
+            analytics.record(
+                current_site().id,
+                endpoint,
+                project_id=(request.view_args or {}).get('project_id'),
+                referrer=referrer_host(request.referrer, request.host)
+            )
+        return response
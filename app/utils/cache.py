@@ -0,0 +1,136 @@
+"""In-memory caching primitives"""
+import threading
+import time
+from collections import OrderedDict
+
+
+def byte_size(value):
+    """
+    Approximate the memory cost of a cached value
+
+    Args:
+        value: Cached value (str, bytes, or a tuple/list of those)
+
+    Returns:
+        Size of the value in bytes
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sum(byte_size(item) for item in value)
+    return len(str(value).encode('utf-8'))
+
+
+class LRUByteCache:
+    """
+    Thread-safe LRU cache bounded by the total byte size of its values
+
+    Entries may carry an optional time-to-live. The least recently used
+    entries are evicted once the byte budget is exceeded, and values larger
+    than the whole budget are never stored.
+    """
+
+    def __init__(self, max_bytes, default_timeout=None):
+        """
+        Args:
+            max_bytes: Maximum combined size of cached values in bytes
+            default_timeout: Default time-to-live in seconds (None = no expiry)
+        """
+        self.max_bytes = max_bytes
+        self.default_timeout = default_timeout
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key):
+        """
+        Look up a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None when missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, _, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, timeout=None):
+        """
+        Store a value, evicting least recently used entries as needed
+
+        Args:
+            key: Cache key
+            value: Value to store (str or bytes)
+            timeout: Time-to-live in seconds (defaults to default_timeout)
+
+        Returns:
+            True if the value was stored
+        """
+        size = byte_size(value)
+        if timeout is None:
+            timeout = self.default_timeout
+        expires_at = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return False
+            self._entries[key] = (value, size, expires_at)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+            return True
+
+    def delete(self, key):
+        """Remove a single entry if present"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """
+        Summarize cache usage
+
+        Returns:
+            Dictionary with entry count, byte usage and hit/miss counters
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+    def _remove(self, key):
+        """Drop an entry; caller must hold the lock"""
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
@@ -0,0 +1,236 @@
+"""Branded error pages rendered once and served from memory
+
+Each site's error pages are rendered on first use per content version and
+kept as bytes. Misses whose outcome depends only on the URL map and the
+site content are counted per host and path; once such a dead URL has been
+requested often enough, the WSGI middleware answers it before Flask
+builds a request context.
+"""
+import threading
+from collections import OrderedDict
+
+from flask import request
+from werkzeug.http import HTTP_STATUS_CODES
+
+from app.utils.cache import LRUByteCache
+from app.utils.sites import current_site, render_site_template
+
+ERROR_TITLES = {
+    404: 'Page not found',
+    410: 'Page removed',
+    500: 'Internal server error'
+}
+
+# Endpoints whose 404/410 depends only on site content (other views may
+# answer 404 from worker-local state, e.g. resume files not built yet)
+CONTENT_MISS_ENDPOINTS = ('projects.detail',)
+
+
+class ErrorPages:
+    """
+    Cache of rendered error pages plus per-path miss counters
+
+    The miss counters are bounded: only the ``max_tracked_paths`` most
+    recently missed URLs are remembered.
+    """
+
+    def __init__(self, registry, cache_bytes=512 * 1024, max_tracked_paths=10000,
+                 fast_path_threshold=3, max_age=300):
+        """
+        Args:
+            registry: SiteRegistry used to resolve hosts in the middleware
+            cache_bytes: Memory budget for rendered pages
+            max_tracked_paths: Number of missed URLs to remember
+            fast_path_threshold: Misses after which a URL skips Flask entirely
+            max_age: Cache-Control max-age for 404/410 responses
+        """
+        self.registry = registry
+        self.pages = LRUByteCache(cache_bytes)
+        self.max_tracked_paths = max_tracked_paths
+        self.fast_path_threshold = fast_path_threshold
+        self.max_age = max_age
+        self._misses = OrderedDict()
+        self._lock = threading.Lock()
+
+    def missing(self, status):
+        """
+        Build a 404/410 response, recording the miss when it is permanent
+
+        Only routing misses and content lookups (``CONTENT_MISS_ENDPOINTS``)
+        are recorded; they cannot become valid without a content change.
+
+        Args:
+            status: HTTP status code (404 or 410)
+
+        Returns:
+            (body, status, headers) tuple
+        """
+        if request.url_rule is None or request.endpoint in CONTENT_MISS_ENDPOINTS:
+            host, path = miss_key(request.environ)
+            self.record_miss(host, path, current_site(), status)
+        return self.response(status)
+
+    def response(self, status):
+        """
+        Build an error response for the current request
+
+        Args:
+            status: HTTP status code (404, 410 or 500)
+
+        Returns:
+            (body, status, headers) tuple
+        """
+        try:
+            site = current_site()
+            body = self.page(site, status)
+        except Exception:  # pylint: disable=broad-except
+            # Never let a broken template turn an error into another error
+            body = ERROR_TITLES[status].encode('utf-8')
+            return body, status, {'Content-Type': 'text/plain; charset=utf-8'}
+        return body, status, self.headers(status)
+
+    def page(self, site, status):
+        """
+        Rendered error page for a site, rendering it on first use
+
+        Args:
+            site: Site instance
+            status: HTTP status code
+
+        Returns:
+            Page body as bytes
+        """
+        key = (site.id, site.content_version, status)
+        body = self.pages.get(key)
+        if body is None:
+            body = render_site_template(
+                f'errors/{status}.html',
+                title=f'{ERROR_TITLES[status]} | {site.name}'
+            ).encode('utf-8')
+            self.pages.set(key, body)
+        return body
+
+    def headers(self, status):
+        """Response headers for an error status"""
+        headers = {'Content-Type': 'text/html; charset=utf-8'}
+        if status == 500:
+            headers['Cache-Control'] = 'no-store'
+        else:
+            headers['Cache-Control'] = f'public, max-age={self.max_age}'
+        return headers
+
+    def record_miss(self, host, path, site, status=404):
+        """
+        Count a 404/410 for a URL
+
+        Counters reset when the site's content version changes, since new
+        content may make the URL valid.
+
+        Args:
+            host: Request host
+            path: Request path
+            site: Site serving the host
+            status: Status the URL answered with
+
+        Returns:
+            Number of misses recorded for the URL
+        """
+        key = (host, path)
+        with self._lock:
+            version, count, _ = self._misses.pop(key, (site.content_version, 0, status))
+            if version != site.content_version:
+                version, count = site.content_version, 0
+            self._misses[key] = (version, count + 1, status)
+            while len(self._misses) > self.max_tracked_paths:
+                self._misses.popitem(last=False)
+            return count + 1
+
+    def misses(self, host, path):
+        """Number of recorded misses for a URL"""
+        with self._lock:
+            return self._misses.get((host, path), (None, 0, None))[1]
+
+    def fast_path(self, host, path):
+        """
+        Cached error page for a URL that keeps being requested, if any
+
+        Args:
+            host: Request host
+            path: Request path
+
+        Returns:
+            (status, body) tuple, or None to handle the request normally
+        """
+        with self._lock:
+            version, count, status = self._misses.get((host, path), (None, 0, None))
+        if count < self.fast_path_threshold:
+            return None
+        site = self.registry.resolve(host)
+        if version != site.content_version:
+            return None
+        body = self.pages.get((site.id, version, status))
+        return None if body is None else (status, body)
+
+
+def miss_key(environ):
+    """
+    Host and path a miss is tracked under
+
+    Both are taken from the raw WSGI environ (``PATH_INFO`` is still
+    latin-1 encoded), so the Flask handler and the middleware agree on
+    the key for non-ASCII paths.
+
+    Args:
+        environ: WSGI environ
+
+    Returns:
+        (host, path) tuple
+    """
+    host = environ.get('HTTP_HOST') or environ.get('SERVER_NAME', '')
+    return host, environ.get('PATH_INFO', '')
+
+
+class DeadPathMiddleware:
+    """Answer frequently missed URLs from memory, ahead of the Flask app"""
+
+    def __init__(self, wsgi_app, error_pages):
+        """
+        Args:
+            wsgi_app: Wrapped WSGI application
+            error_pages: ErrorPages instance holding the counters and pages
+        """
+        self.wsgi_app = wsgi_app
+        self.error_pages = error_pages
+
+    def __call__(self, environ, start_response):
+        if environ.get('REQUEST_METHOD') in ('GET', 'HEAD'):
+            cached = self.error_pages.fast_path(*miss_key(environ))
+            if cached is not None:
+                status, body = cached
+                headers = list(self.error_pages.headers(status).items())
+                headers.append(('Content-Length', str(len(body))))
+                start_response(f'{status} {HTTP_STATUS_CODES[status].upper()}', headers)
+                return [] if environ['REQUEST_METHOD'] == 'HEAD' else [body]
+        return self.wsgi_app(environ, start_response)
+
+
+def init_error_pages(app):
+    """
+    Create the error page cache and mount the dead-path middleware
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        ErrorPages instance
+    """
+    error_pages = ErrorPages(
+        app.extensions['sites'],
+        cache_bytes=app.config.get('ERROR_PAGE_CACHE_BYTES', 512 * 1024),
+        max_tracked_paths=app.config.get('ERROR_PAGE_MAX_TRACKED_PATHS', 10000),
+        fast_path_threshold=app.config.get('ERROR_PAGE_FAST_PATH_THRESHOLD', 3),
+        max_age=app.config.get('ERROR_PAGE_MAX_AGE', 300)
+    )
+    app.extensions['error_pages'] = error_pages
+    app.wsgi_app = DeadPathMiddleware(app.wsgi_app, error_pages)
+    return error_pages
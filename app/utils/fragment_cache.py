@@ -0,0 +1,97 @@
+"""Jinja fragment caching: {% cache key[, ttl] %}...{% endcache %}"""
+import hashlib
+
+from flask import has_request_context, request
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from app.utils.cache import LRUByteCache
+from app.utils.sites import SITE_ENVIRON_KEY
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Cache the rendered output of a template block
+
+    Usage::
+
+        {% cache 'footer' %}...{% endcache %}
+        {% cache 'technologies', 3600 %}...{% endcache %}
+
+    The key expression may be any value (string, tuple, dict...). The final
+    cache key combines the active site and its content version, the template
+    name, the key value and the request endpoint, so blocks that highlight
+    the current page are cached per endpoint.
+    """
+
+    tags = {'cache'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=None)
+
+    def parse(self, parser):
+        """Parse ``{% cache key[, ttl] %}`` up to ``{% endcache %}``"""
+        lineno = next(parser.stream).lineno
+        args = [nodes.Const(parser.name), parser.parse_expression()]
+        if parser.stream.skip_if('comma'):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(None))
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method('_render_cached', args), [], [], body
+        ).set_lineno(lineno)
+
+    def _render_cached(self, template_name, key, timeout, caller):
+        """Return the cached fragment, rendering it on a miss"""
+        cache = self.environment.fragment_cache
+        if cache is None:
+            return caller()
+
+        cache_key = make_fragment_key(template_name, key)
+        value = cache.get(cache_key)
+        if value is None:
+            value = str(caller())
+            cache.set(cache_key, value, timeout)
+        return Markup(value)
+
+
+def make_fragment_key(template_name, key):
+    """
+    Build a fragment cache key
+
+    Args:
+        template_name: Name of the template containing the block
+        key: Key value given in the template tag
+
+    Returns:
+        Stable string key
+    """
+    endpoint = site_key = None
+    if has_request_context():
+        endpoint = request.endpoint
+        site = request.environ.get(SITE_ENVIRON_KEY)
+        if site is not None:
+            site_key = (site.id, site.content_version)
+    raw = repr((site_key, template_name, key, endpoint))
+    return 'fragment:' + hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def init_fragment_cache(app):
+    """
+    Register the fragment cache extension on the application
+
+    Args:
+        app: Flask application instance
+    """
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    cache = None
+    if app.config.get('FRAGMENT_CACHE_ENABLED', True):
+        cache = LRUByteCache(
+            app.config.get('FRAGMENT_CACHE_MAX_BYTES', 4 * 1024 * 1024),
+            app.config.get('FRAGMENT_CACHE_DEFAULT_TIMEOUT')
+        )
+    app.jinja_env.fragment_cache = cache
+    app.extensions['fragment_cache'] = cache
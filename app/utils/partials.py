@@ -0,0 +1,16 @@
+"""Detection of partial (fragment-only) requests made by the filter script"""
+from flask import request
+
+
+def is_partial_request():
+    """
+    Whether the client asked for a page fragment only
+
+    Filter links send ``HX-Request: true`` (or ``?partial=grid`` without
+    JavaScript fetch) to receive just the project grid.
+
+    Returns:
+        True for partial requests
+    """
+    return (request.headers.get('HX-Request') == 'true'
+            or request.args.get('partial') == 'grid')
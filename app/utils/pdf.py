@@ -0,0 +1,162 @@
+"""Minimal text-only PDF writer (no third-party dependencies)
+
+Uses the built-in Helvetica fonts with WinAnsi encoding, so the output is
+small and byte-for-byte deterministic for the same input.
+"""
+import zlib
+
+# Approximate average glyph widths (fraction of the font size)
+CHAR_WIDTH = {False: 0.52, True: 0.58}
+
+
+class PDFDocument:
+    """
+    Flowing text document laid out top to bottom on US Letter pages
+
+    Usage::
+
+        doc = PDFDocument()
+        doc.text('Title', size=20, bold=True)
+        doc.text('Body copy that wraps automatically...')
+        pdf_bytes = doc.render()
+    """
+
+    def __init__(self, page_width=612, page_height=792, margin=54):
+        """
+        Args:
+            page_width: Page width in points
+            page_height: Page height in points
+            margin: Margin on every side in points
+        """
+        self.page_width = page_width
+        self.page_height = page_height
+        self.margin = margin
+        self.pages = []
+        self.y = 0
+        self._new_page()
+
+    def text(self, text, size=10, bold=False, indent=0, space_after=4, align='left'):
+        """
+        Add a wrapped paragraph
+
+        Args:
+            text: Paragraph text
+            size: Font size in points
+            bold: Use Helvetica-Bold
+            indent: Left indent in points
+            space_after: Extra space below the paragraph in points
+            align: 'left' or 'center'
+        """
+        width = self.page_width - 2 * self.margin - indent
+        leading = size * 1.3
+        for line in wrap(text, width, size, bold):
+            if self.y - leading < self.margin:
+                self._new_page()
+            self.y -= leading
+            x = self.margin + indent
+            if align == 'center':
+                x = (self.page_width - text_width(line, size, bold)) / 2
+            font = 'F2' if bold else 'F1'
+            self.pages[-1].append(
+                f'BT /{font} {size} Tf {x:.2f} {self.y:.2f} Td ({escape(line)}) Tj ET'
+            )
+        self.y -= space_after
+
+    def rule(self, space_after=6):
+        """Draw a horizontal line across the text area"""
+        if self.y - space_after < self.margin:
+            self._new_page()
+        self.y -= 2
+        self.pages[-1].append(
+            f'0.5 w {self.margin} {self.y:.2f} m '
+            f'{self.page_width - self.margin} {self.y:.2f} l S'
+        )
+        self.y -= space_after
+
+    def render(self):
+        """
+        Serialize the document
+
+        Returns:
+            PDF file contents as bytes
+        """
+        objects = [
+            b'<< /Type /Catalog /Pages 2 0 R >>',
+            None,  # page tree, filled in below
+            b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+            b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>'
+        ]
+        page_ids = []
+        for operations in self.pages:
+            stream = zlib.compress('\n'.join(operations).encode('cp1252', 'replace'), 9)
+            objects.append(
+                b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(stream)
+                + stream + b'\nendstream'
+            )
+            content_id = len(objects)
+            objects.append(
+                b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] '
+                b'/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>'
+                % (self.page_width, self.page_height, content_id)
+            )
+            page_ids.append(len(objects))
+        kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+        objects[1] = f'<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>'.encode()
+
+        output = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(output))
+            output += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+        xref = len(output)
+        output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+        for offset in offsets:
+            output += b'%010d 00000 n \n' % offset
+        output += (b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                   % (len(objects) + 1, xref))
+        return bytes(output)
+
+    def _new_page(self):
+        """Start a new page and reset the cursor to the top margin"""
+        self.pages.append([])
+        self.y = self.page_height - self.margin
+
+
+def text_width(text, size, bold=False):
+    """Estimate the rendered width of a string in points"""
+    return len(text) * size * CHAR_WIDTH[bold]
+
+
+def wrap(text, width, size, bold=False):
+    """
+    Break text into lines that fit the given width
+
+    Args:
+        text: Text to wrap
+        width: Available width in points
+        size: Font size in points
+        bold: Whether the bold font is used
+
+    Returns:
+        List of lines (at least one)
+    """
+    max_chars = max(1, int(width / (size * CHAR_WIDTH[bold])))
+    lines, current = [], ''
+    for word in text.split():
+        candidate = f'{current} {word}' if current else word
+        if len(candidate) <= max_chars:
+            current = candidate
+            continue
+        if current:
+            lines.append(current)
+        while len(word) > max_chars:
+            lines.append(word[:max_chars])
+            word = word[max_chars:]
+        current = word
+    lines.append(current)
+    return lines
+
+
+def escape(text):
+    """Escape a string for use inside a PDF literal string"""
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
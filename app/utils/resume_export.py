@@ -0,0 +1,345 @@
+"""Resume export pipeline: printable HTML and PDF built per content version
+
+Artifacts are generated by a background worker and stored on disk under
+content-hash names, so the request path only ever serves finished files.
+"""
+import hashlib
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from collections import namedtuple
+
+from flask import render_template
+
+from app.utils.pdf import PDFDocument
+
+logger = logging.getLogger(__name__)
+
+Artifact = namedtuple('Artifact', 'path filename etag mimetype')
+
+EXPORT_FORMATS = {
+    'html': 'text/html',
+    'pdf': 'application/pdf'
+}
+
+ARTIFACT_NAME = re.compile(r'resume-([0-9a-f]{16})\.(pdf|html)')
+
+
+def build_resume(site):
+    """
+    Assemble resume data from a site's business and project content
+
+    Args:
+        site: Site instance
+
+    Returns:
+        Dictionary used by the resume page and both export formats
+    """
+    content = site.content
+    resume = content['resume']
+    profile = site.profile
+    return {
+        'name': site.name,
+        'headline': profile['headline'],
+        'email': profile['email'],
+        'linkedin_url': profile['linkedin_url'],
+        'github_url': profile['github_url'],
+        'summary': resume['summary'],
+        'education': resume['education'],
+        'technical_skills': resume['technical_skills'],
+        'business_skills': [skill['name'] for skill in content['business']['skills']],
+        'experience': [
+            dict(job, highlights=job.get('highlights') or [job['description']])
+            for job in content['business']['experience']
+        ],
+        'projects': [
+            site.get_project(project_id) for project_id in resume['projects']
+            if site.get_project(project_id)
+        ]
+    }
+
+
+def render_resume_pdf(resume):
+    """
+    Lay out the resume as a PDF
+
+    Args:
+        resume: Data from build_resume
+
+    Returns:
+        PDF file contents as bytes
+    """
+    doc = PDFDocument()
+    doc.text(resume['name'], size=22, bold=True, align='center', space_after=2)
+    doc.text(resume['headline'], size=11, align='center', space_after=2)
+    doc.text(' | '.join([resume['email'], resume['linkedin_url'], resume['github_url']]),
+             size=9, align='center', space_after=10)
+
+    def section(title):
+        doc.text(title, size=13, bold=True, space_after=0)
+        doc.rule()
+
+    section('Professional Summary')
+    doc.text(resume['summary'], space_after=10)
+
+    section('Education')
+    for school in resume['education']:
+        doc.text(f"{school['school']} ({school['period']})", size=11, bold=True, space_after=1)
+        doc.text(school['degree'], space_after=1)
+        doc.text(school['details'], size=9, space_after=8)
+
+    section('Skills')
+    doc.text('Technical: ' + '; '.join(resume['technical_skills']), space_after=2)
+    doc.text('Business: ' + '; '.join(resume['business_skills']), space_after=10)
+
+    section('Experience')
+    for job in resume['experience']:
+        doc.text(f"{job['title']}, {job['company']} ({job['period']})",
+                 size=11, bold=True, space_after=1)
+        for highlight in job['highlights']:
+            doc.text(f'• {highlight}', indent=12, space_after=1)
+        doc.text('', size=4)
+
+    section('Featured Projects')
+    for project in resume['projects']:
+        doc.text(project['title'], size=11, bold=True, space_after=1)
+        doc.text(project['description'], space_after=1)
+        doc.text('Technologies: ' + ', '.join(project['tags']), size=9, space_after=6)
+
+    return doc.render()
+
+
+class ResumeExporter:
+    """
+    Build and track resume artifacts for every site
+
+    Builds are queued with ``request_build`` and executed by a daemon
+    thread. Sites that already have exports are rebuilt when the site
+    registry reports a content change. With ``background`` disabled no
+    thread is started and queued builds run on ``run_pending``.
+    """
+
+    def __init__(self, app, export_dir, background=True, stale_grace=600):
+        """
+        Args:
+            app: Flask application (templates are rendered in its context)
+            export_dir: Directory the artifacts are written to
+            background: Build on a worker thread (False = manual)
+            stale_grace: Seconds an outdated artifact is kept for other
+                workers sharing the directory
+        """
+        self.app = app
+        self.export_dir = export_dir
+        self.background = background
+        self.stale_grace = stale_grace
+        self._stale_since = {}
+        self._artifacts = {}
+        self._pending = set()
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def get(self, site, export_format):
+        """
+        Current artifact for a site, queueing a build when it is missing or stale
+
+        A stale artifact is still returned while its replacement is built.
+
+        Args:
+            site: Site instance
+            export_format: 'html' or 'pdf'
+
+        Returns:
+            Artifact, or None if nothing has been built yet
+        """
+        version, artifacts = self._artifacts.get(site.id, (None, {}))
+        if version != site.content_version:
+            self.request_build(site)
+        return artifacts.get(export_format)
+
+    def find(self, site, filename):
+        """
+        Look up one of a site's artifacts by file name
+
+        Artifacts built by other workers sharing the export directory are
+        found on disk; their content-hash names make them safe to serve.
+
+        Args:
+            site: Site instance
+            filename: Artifact file name
+
+        Returns:
+            Artifact, or None if it does not exist
+        """
+        _, artifacts = self._artifacts.get(site.id, (None, {}))
+        for artifact in artifacts.values():
+            if artifact.filename == filename:
+                return artifact
+        match = ARTIFACT_NAME.fullmatch(filename)
+        if match is None:
+            return None
+        path = os.path.join(self.export_dir, site.id, filename)
+        if not os.path.isfile(path):
+            return None
+        digest, export_format = match.groups()
+        return Artifact(path, filename, digest, EXPORT_FORMATS[export_format])
+
+    def request_build(self, site):
+        """Queue a (re)build for a site; duplicate requests are ignored"""
+        with self._lock:
+            if site.id in self._pending:
+                return
+            self._pending.add(site.id)
+        self._queue.put(site)
+        self._ensure_worker()
+
+    def run_pending(self):
+        """
+        Build every queued site in the calling thread
+
+        Returns:
+            Number of sites built
+        """
+        built = 0
+        while True:
+            try:
+                site = self._queue.get_nowait()
+            except queue.Empty:
+                return built
+            self._build_queued(site)
+            built += 1
+
+    def build(self, site):
+        """
+        Render and store the artifacts for a site's current content
+
+        Args:
+            site: Site instance
+
+        Returns:
+            Dictionary mapping export format to Artifact
+        """
+        version = site.content_version
+        resume = build_resume(site)
+        with self.app.app_context():
+            html = render_template('exports/resume.html', resume=resume, site=site)
+        rendered = {
+            'html': html.encode('utf-8'),
+            'pdf': render_resume_pdf(resume)
+        }
+
+        directory = os.path.join(self.export_dir, site.id)
+        os.makedirs(directory, exist_ok=True)
+        artifacts = {
+            export_format: self._store(directory, export_format, data)
+            for export_format, data in rendered.items()
+        }
+        self._artifacts[site.id] = (version, artifacts)
+        self._remove_stale(directory, artifacts)
+        return artifacts
+
+    def content_changed(self, site):
+        """
+        Queue a rebuild for a site whose content changed
+
+        Registered with the site registry; sites without exports are left
+        alone until their resume is requested.
+
+        Args:
+            site: Reloaded Site instance
+        """
+        if site.id in self._artifacts:
+            self.request_build(site)
+
+    def _build_queued(self, site):
+        """Build one queued site, logging failures"""
+        with self._lock:
+            self._pending.discard(site.id)
+        try:
+            self.build(site)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Resume export failed for site %s', site.id)
+
+    @staticmethod
+    def _store(directory, export_format, data):
+        """
+        Write an artifact under its content-hash name (atomically, once)
+
+        An existing file is touched instead, so its mtime shows that a
+        worker is still serving it.
+        """
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        filename = f'resume-{digest}.{export_format}'
+        path = os.path.join(directory, filename)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            temp_path = f'{path}.{os.getpid()}.tmp'
+            with open(temp_path, 'wb') as handle:
+                handle.write(data)
+            os.replace(temp_path, path)
+        return Artifact(path, filename, digest, EXPORT_FORMATS[export_format])
+
+    def _remove_stale(self, directory, artifacts):
+        """
+        Delete artifacts from previous content versions after a grace period
+
+        Other workers sharing the directory may still serve an older
+        version or be writing a temporary file, so only finished files that
+        have been stale (and untouched) for ``stale_grace`` seconds go.
+        """
+        current = {artifact.filename for artifact in artifacts.values()}
+        now = time.time()
+        for filename in os.listdir(directory):
+            path = os.path.join(directory, filename)
+            if filename in current:
+                self._stale_since.pop(path, None)
+                continue
+            if not filename.startswith('resume-') or filename.endswith('.tmp'):
+                continue
+            stale_since = self._stale_since.setdefault(path, now)
+            try:
+                if now - max(os.stat(path).st_mtime, stale_since) < self.stale_grace:
+                    continue
+                os.remove(path)
+            except OSError:
+                pass
+            self._stale_since.pop(path, None)
+
+    def _ensure_worker(self):
+        """Start the worker thread once per process (workers may be forked)"""
+        if not self.background or self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='resume-export',
+                                            daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Process queued builds"""
+        while True:
+            self._build_queued(self._queue.get())
+
+
+def init_resume_export(app):
+    """
+    Attach the resume exporter to the application
+
+    Args:
+        app: Flask application instance
+    """
+    exporter = ResumeExporter(
+        app,
+        app.config.get('RESUME_EXPORT_DIR') or os.path.join(app.instance_path, 'exports'),
+        app.config.get('RESUME_EXPORT_BACKGROUND', True),
+        app.config.get('RESUME_EXPORT_STALE_GRACE', 600)
+    )
+    app.extensions['resume_export'] = exporter
+    app.extensions['sites'].on_content_change(exporter.content_changed)
@@ -0,0 +1,93 @@
+"""Enumerate every public page URL of a site from the application URL map
+
+Rules without arguments are listed as-is. Rules with arguments (such as
+``/projects/<project_id>``) are expanded by value providers registered
+with ``url_values``; rules without a provider are skipped.
+"""
+from collections import namedtuple
+
+SiteURL = namedtuple('SiteURL', 'endpoint path values')
+
+# Blueprints that never contain crawlable pages
+EXCLUDED_BLUEPRINTS = ('api', 'admin', 'discovery')
+
+# Placeholder or non-canonical pages left out of listings
+EXCLUDED_ENDPOINTS = ('main.about',)
+
+_value_providers = {}
+
+
+def url_values(endpoint):
+    """
+    Register the URL arguments an endpoint is published with
+
+    Usage::
+
+        @url_values('projects.detail')
+        def project_urls(site):
+            return [{'project_id': project['id']} for project in site.projects]
+
+    Args:
+        endpoint: Endpoint name
+
+    Returns:
+        Decorator for a callable taking a Site and returning an iterable
+        of argument dictionaries
+    """
+    def decorator(provider):
+        _value_providers[endpoint] = provider
+        return provider
+    return decorator
+
+
+def is_public_endpoint(endpoint):
+    """Whether an endpoint serves pages meant to be listed and crawled"""
+    blueprint = endpoint.rpartition('.')[0]
+    return (endpoint != 'static' and endpoint not in EXCLUDED_ENDPOINTS
+            and blueprint not in EXCLUDED_BLUEPRINTS)
+
+
+def site_urls(app, site):
+    """
+    List every public GET URL of a site
+
+    Args:
+        app: Flask application
+        site: Site instance (used to expand argument rules)
+
+    Returns:
+        List of SiteURL tuples in URL map order
+    """
+    adapter = app.url_map.bind('', script_name=app.config.get('APPLICATION_ROOT') or '/')
+    urls = []
+    for rule in app.url_map.iter_rules():
+        if 'GET' not in rule.methods or not is_public_endpoint(rule.endpoint):
+            continue
+        if rule.arguments:
+            provider = _value_providers.get(rule.endpoint)
+            if provider is None:
+                continue
+            expansions = provider(site)
+        else:
+            expansions = [{}]
+        for values in expansions:
+            path = adapter.build(rule.endpoint, values, append_unknown=False)
+            urls.append(SiteURL(rule.endpoint, path, values))
+    return urls
+
+
+def disallowed_prefixes(app):
+    """
+    URL prefixes of blueprints excluded from crawling
+
+    Args:
+        app: Flask application
+
+    Returns:
+        Sorted list of path prefixes (e.g. ``['/admin/', '/api/v1/']``)
+    """
+    return sorted(
+        blueprint.url_prefix.rstrip('/') + '/'
+        for name, blueprint in app.blueprints.items()
+        if name in EXCLUDED_BLUEPRINTS and blueprint.url_prefix
+    )
@@ -0,0 +1,447 @@
+"""Multi-site hosting: per-host content snapshots, themes and page caches"""
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timezone
+
+from flask import current_app, has_request_context, render_template, request, session
+from jinja2 import TemplateNotFound
+
+from app.utils.cache import LRUByteCache
+
+logger = logging.getLogger(__name__)
+
+SITE_ENVIRON_KEY = 'portfolio.site'
+
+# One loaded content file; replaced as a whole so readers never mix versions
+ContentSnapshot = namedtuple('ContentSnapshot', 'content version modified mtime_ns projects_by_id')
+
+
+class Site:
+    """
+    A hosted portfolio
+
+    Content is loaded lazily from its JSON snapshot on first access. Each
+    site owns a rendered-page cache with its own memory quota.
+    """
+
+    def __init__(self, site_id, content_path, hosts=(), theme='default',
+                 cache_quota_bytes=2 * 1024 * 1024, canonical_url=None):
+        """
+        Args:
+            site_id: Unique site identifier
+            content_path: Path to the site's JSON content snapshot
+            hosts: Host names served by this site
+            theme: Theme name used to look up template overrides
+            cache_quota_bytes: Memory quota for rendered pages
+            canonical_url: Base URL for absolute links (defaults to https
+                on the first host)
+        """
+        self.id = site_id
+        self.content_path = content_path
+        self.hosts = tuple(host.lower() for host in hosts)
+        if not canonical_url:
+            canonical_url = f'https://{self.hosts[0]}' if self.hosts else 'http://localhost'
+        self.canonical_url = canonical_url.rstrip('/')
+        self.theme = theme
+        self.page_cache = LRUByteCache(cache_quota_bytes)
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'<Site {self.id}>'
+
+    @property
+    def loaded(self):
+        """Whether the content snapshot has been read"""
+        return self._snapshot is not None
+
+    @property
+    def snapshot(self):
+        """
+        Current ContentSnapshot, loaded from disk on first access
+
+        Code that reads several fields should read them from one snapshot,
+        since a reload may replace it in between.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = self._load(None)
+                snapshot = self._snapshot
+        return snapshot
+
+    @property
+    def content(self):
+        """Site content, loaded from disk on first access"""
+        return self.snapshot.content
+
+    @property
+    def content_version(self):
+        """Short hash identifying the loaded content snapshot"""
+        return self.snapshot.version
+
+    @property
+    def content_modified(self):
+        """UTC time the loaded content snapshot was last written"""
+        return self.snapshot.modified
+
+    @property
+    def profile(self):
+        """Owner profile (name, contact links...)"""
+        return self.content['profile']
+
+    @property
+    def name(self):
+        """Display name of the portfolio owner"""
+        return self.profile['name']
+
+    @property
+    def projects(self):
+        """All projects in display order"""
+        return self.content['projects']['items']
+
+    def get_project(self, project_id):
+        """
+        Look up a project by id
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Project dictionary, or None if unknown
+        """
+        return self.snapshot.projects_by_id.get(project_id)
+
+    def content_file_changed(self):
+        """
+        Whether the content file was written since it was loaded
+
+        Returns:
+            True if a loaded snapshot's file has a different mtime
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return False
+        try:
+            return os.stat(self.content_path).st_mtime_ns != snapshot.mtime_ns
+        except OSError:
+            return False
+
+    def reload(self):
+        """
+        Re-read the content snapshot from disk
+
+        Returns:
+            True if the content version changed
+        """
+        with self._lock:
+            previous = self._snapshot
+            self._snapshot = self._load(previous)
+            changed = previous is None or self._snapshot.version != previous.version
+        if changed:
+            self.page_cache.clear()
+        return changed
+
+    def _load(self, previous):
+        """
+        Read and index the content file; caller must hold the lock
+
+        Args:
+            previous: Snapshot being replaced, or None
+
+        Returns:
+            New ContentSnapshot
+        """
+        with open(self.content_path, 'rb') as handle:
+            raw = handle.read()
+            mtime_ns = os.fstat(handle.fileno()).st_mtime_ns
+        content = json.loads(raw)
+        version = hashlib.sha1(raw).hexdigest()[:12]
+        if previous is not None and previous.version == version:
+            # A touched but unchanged file keeps its original timestamp
+            modified = previous.modified
+        else:
+            modified = datetime.fromtimestamp(mtime_ns // 10**9, tz=timezone.utc)
+        return ContentSnapshot(
+            content, version, modified, mtime_ns,
+            {p['id']: p for p in content['projects']['items']}
+        )
+
+
+class SiteRegistry:
+    """
+    Map request hosts to sites and keep total page-cache memory bounded
+
+    When the combined size of all page caches exceeds ``total_cache_bytes``,
+    the rendered pages of the least recently active sites are dropped.
+
+    Loaded sites' content files are polled every ``poll_interval`` seconds
+    by a daemon thread in each worker process; changed sites are reloaded
+    and the callbacks registered with ``on_content_change`` are notified.
+    With ``poll_interval`` set to 0 no thread is started and changes are
+    picked up on ``check_for_changes``.
+    """
+
+    def __init__(self, sites, default_site_id, total_cache_bytes=32 * 1024 * 1024,
+                 poll_interval=0):
+        """
+        Args:
+            sites: Iterable of Site instances
+            default_site_id: Site served for unknown hosts
+            total_cache_bytes: Page-cache budget shared by all sites
+            poll_interval: Seconds between content change checks (0 = manual)
+        """
+        self.sites = {site.id: site for site in sites}
+        self.default = self.sites[default_site_id]
+        self.total_cache_bytes = total_cache_bytes
+        self.poll_interval = poll_interval
+        self._hosts = {host: site for site in self.sites.values() for host in site.hosts}
+        self._activity = OrderedDict()
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._pid = None
+
+    @classmethod
+    def from_file(cls, path, content_dir, cache_quota_bytes, total_cache_bytes,
+                  poll_interval=0):
+        """
+        Build a registry from a sites.json file
+
+        Args:
+            path: Path to sites.json
+            content_dir: Directory containing the content snapshots
+            cache_quota_bytes: Per-site page-cache quota
+            total_cache_bytes: Page-cache budget shared by all sites
+            poll_interval: Seconds between content change checks (0 = manual)
+
+        Returns:
+            SiteRegistry instance
+        """
+        with open(path, encoding='utf-8') as handle:
+            config = json.load(handle)
+        sites = [
+            Site(
+                site_id,
+                os.path.join(content_dir, options['content']),
+                hosts=options.get('hosts', ()),
+                theme=options.get('theme', 'default'),
+                cache_quota_bytes=options.get('cache_quota_bytes', cache_quota_bytes),
+                canonical_url=options.get('canonical_url')
+            )
+            for site_id, options in config['sites'].items()
+        ]
+        return cls(sites, config['default'], total_cache_bytes, poll_interval)
+
+    def resolve(self, host):
+        """
+        Find the site serving a host
+
+        Args:
+            host: Request Host header (port is ignored)
+
+        Returns:
+            Matching Site, or the default site
+        """
+        host = (host or '').lower()
+        if not host.endswith(']'):
+            host = host.rsplit(':', 1)[0]
+        site = self._hosts.get(host, self.default)
+        with self._lock:
+            self._activity[site.id] = True
+            self._activity.move_to_end(site.id)
+        return site
+
+    def cache_bytes(self):
+        """Combined size of all site page caches"""
+        return sum(site.page_cache.current_bytes for site in self.sites.values())
+
+    def enforce_budget(self):
+        """Drop page caches of the least recently active sites until under budget"""
+        with self._lock:
+            order = list(self._activity)
+        for site_id in order[:-1]:
+            if self.cache_bytes() <= self.total_cache_bytes:
+                break
+            self.sites[site_id].page_cache.clear()
+
+    def on_content_change(self, callback):
+        """
+        Register a callable notified with each site whose content changed
+
+        Args:
+            callback: Callable taking the reloaded Site
+        """
+        self._listeners.append(callback)
+
+    def check_for_changes(self):
+        """
+        Reload loaded sites whose content file changed
+
+        Reloading clears the site's page cache; listeners are notified
+        when the content version actually changed.
+
+        Returns:
+            List of site identifiers whose content changed
+        """
+        changed = []
+        for site in self.sites.values():
+            if not site.content_file_changed() or not site.reload():
+                continue
+            changed.append(site.id)
+            for callback in self._listeners:
+                try:
+                    callback(site)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception('Content change listener failed for site %s', site.id)
+        return changed
+
+    def start_polling(self):
+        """Start the content poller once per process (workers may be forked)"""
+        if not self.poll_interval or self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            threading.Thread(target=self._poll, name='site-content-poll', daemon=True).start()
+
+    def _poll(self):
+        """Check for content changes periodically"""
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                self.check_for_changes()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Content change check failed')
+
+
+def init_sites(app):
+    """
+    Load the site registry, poll its content and expose the active site to templates
+
+    Args:
+        app: Flask application instance
+    """
+    content_dir = app.config['CONTENT_DIR']
+    app.extensions['sites'] = SiteRegistry.from_file(
+        app.config.get('SITES_FILE') or os.path.join(content_dir, 'sites.json'),
+        content_dir,
+        app.config.get('SITE_CACHE_QUOTA_BYTES', 2 * 1024 * 1024),
+        app.config.get('SITE_CACHE_TOTAL_BYTES', 32 * 1024 * 1024),
+        app.config.get('SITE_CONTENT_POLL_INTERVAL', 10)
+    )
+    app.extensions['site_templates'] = {}
+
+    @app.before_request
+    def watch_content():
+        # Every worker keeps its own snapshots, so every worker polls
+        app.extensions['sites'].start_polling()
+
+    @app.context_processor
+    def inject_site():
+        return {'site': current_site()}
+
+
+def current_site():
+    """
+    Site serving the current request, resolved once per request
+
+    Outside a request (CLI commands, background jobs) the default site is
+    returned.
+
+    Returns:
+        Site instance
+    """
+    if not has_request_context():
+        return current_app.extensions['sites'].default
+    site = request.environ.get(SITE_ENVIRON_KEY)
+    if site is None:
+        site = current_app.extensions['sites'].resolve(request.host)
+        request.environ[SITE_ENVIRON_KEY] = site
+    return site
+
+
+def render_site_template(template_name, **context):
+    """
+    Render a template, preferring the active site's theme override
+
+    Themes override a template by providing
+    ``themes/<theme>/<template_name>``.
+
+    Args:
+        template_name: Template path relative to the templates folder
+        **context: Template context
+
+    Returns:
+        Rendered template string
+    """
+    site = current_site()
+    resolved = current_app.extensions['site_templates']
+    key = (site.theme, template_name)
+    if key not in resolved:
+        themed = f'themes/{site.theme}/{template_name}'
+        try:
+            current_app.jinja_env.get_template(themed)
+            resolved[key] = themed
+        except TemplateNotFound:
+            resolved[key] = template_name
+    return render_template(resolved[key], **context)
+
+
+def site_cached(vary_args=(), vary_headers=(), key=None):
+    """
+    Cache a view's rendered response in the active site's page cache
+
+    Only plain GET requests without pending flash messages are cached.
+
+    Args:
+        vary_args: Query-string arguments that change the output
+        vary_headers: Request headers that change the output (also sent
+            back in the ``Vary`` response header)
+        key: Optional callable returning the normalized request variant as
+            a tuple, or None to skip the cache; replaces the raw
+            ``vary_args``/``vary_headers`` values in the cache key
+
+    Returns:
+        View decorator
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            variant = None
+            if (request.method == 'GET'
+                    and current_app.config.get('SITE_PAGE_CACHE_ENABLED', True)
+                    and not session.get('_flashes')):
+                if key is not None:
+                    variant = key()
+                else:
+                    variant = (tuple(request.args.get(arg) for arg in vary_args)
+                               + tuple(request.headers.get(header) for header in vary_headers))
+            if variant is None:
+                response = current_app.make_response(view(*args, **kwargs))
+                response.vary.update(vary_headers)
+                return response
+
+            site = current_site()
+            # Versioned key: a render that straddles a reload cannot
+            # write an outdated page back under the current version
+            cache_key = (site.content_version, request.path) + tuple(variant)
+            body = site.page_cache.get(cache_key)
+            if body is not None:
+                response = current_app.response_class(body, mimetype='text/html')
+            else:
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code == 200 and not response.direct_passthrough:
+                    site.page_cache.set(cache_key, response.get_data())
+                    current_app.extensions['sites'].enforce_budget()
+            response.vary.update(vary_headers)
+            return response
+        return wrapper
+    return decorator
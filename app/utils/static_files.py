@@ -0,0 +1,230 @@
+"""WSGI middleware serving static assets ahead of the Flask app"""
+import mimetypes
+import os
+from datetime import datetime, timezone
+
+from werkzeug.http import (
+    http_date, is_resource_modified, parse_date, parse_range_header, unquote_etag
+)
+from werkzeug.security import safe_join
+from werkzeug.wsgi import FileWrapper
+
+from app.utils.cache import LRUByteCache
+
+CHUNK_SIZE = 64 * 1024
+
+
+class StaticFilesMiddleware:
+    """
+    Serve files under ``url_prefix`` directly from ``root``
+
+    Small files are kept in an in-memory hot set; larger files are streamed
+    with ``wsgi.file_wrapper`` so servers such as gunicorn can use
+    ``sendfile``. Supports strong ETags, ``If-None-Match``,
+    ``If-Modified-Since``, ``Range`` and ``If-Range``. When ``accel_prefix``
+    is set, large files are handed to the fronting proxy through an
+    ``X-Accel-Redirect`` style header instead of being sent by Python.
+    """
+
+    def __init__(self, wsgi_app, root, url_prefix='/static', max_age=3600,
+                 hot_file_max_bytes=256 * 1024, hot_cache_bytes=8 * 1024 * 1024,
+                 accel_prefix=None, accel_header='X-Accel-Redirect'):
+        """
+        Args:
+            wsgi_app: Wrapped WSGI application
+            root: Directory containing the static files
+            url_prefix: URL path the files are mounted under
+            max_age: Cache-Control max-age in seconds
+            hot_file_max_bytes: Largest file kept in memory
+            hot_cache_bytes: Total memory budget for the hot set
+            accel_prefix: Internal proxy location for offloaded files
+            accel_header: Header name used for proxy offloading
+        """
+        self.wsgi_app = wsgi_app
+        self.root = os.path.abspath(root)
+        self.url_prefix = url_prefix.rstrip('/') + '/'
+        self.max_age = max_age
+        self.hot_file_max_bytes = hot_file_max_bytes
+        self.hot_cache = LRUByteCache(hot_cache_bytes)
+        self.accel_prefix = accel_prefix.rstrip('/') + '/' if accel_prefix else None
+        self.accel_header = accel_header
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        if not path.startswith(self.url_prefix):
+            return self.wsgi_app(environ, start_response)
+        return self.serve(environ, start_response, path[len(self.url_prefix):])
+
+    def serve(self, environ, start_response, filename):
+        """
+        Serve a single static file request
+
+        Args:
+            environ: WSGI environment
+            start_response: WSGI start_response callable
+            filename: Path relative to the static root
+
+        Returns:
+            WSGI response iterable
+        """
+        method = environ.get('REQUEST_METHOD', 'GET')
+        if method not in ('GET', 'HEAD'):
+            return _plain(start_response, '405 METHOD NOT ALLOWED',
+                          b'Method not allowed', [('Allow', 'GET, HEAD')])
+
+        full_path = safe_join(self.root, filename) if filename else None
+        try:
+            stat = os.stat(full_path) if full_path else None
+        except OSError:
+            stat = None
+        if stat is None or not os.path.isfile(full_path):
+            return _plain(start_response, '404 NOT FOUND', b'Not found')
+
+        size = stat.st_size
+        etag = f'{stat.st_mtime_ns:x}-{size:x}'
+        last_modified = datetime.fromtimestamp(int(stat.st_mtime), tz=timezone.utc)
+        headers = [
+            ('Content-Type', _content_type(full_path)),
+            ('ETag', f'"{etag}"'),
+            ('Last-Modified', http_date(last_modified)),
+            ('Cache-Control', f'public, max-age={self.max_age}'),
+            ('Accept-Ranges', 'bytes')
+        ]
+
+        if not is_resource_modified(environ, etag=etag, last_modified=last_modified,
+                                    ignore_if_range=True):
+            start_response('304 NOT MODIFIED', headers)
+            return []
+
+        hot = size <= self.hot_file_max_bytes
+        if self.accel_prefix and not hot:
+            accel_path = self.accel_prefix + filename.replace(os.sep, '/')
+            start_response('200 OK', headers + [(self.accel_header, accel_path)])
+            return []
+
+        byte_range = self._requested_range(environ, etag, last_modified, size)
+        if byte_range == 'unsatisfiable':
+            return _plain(start_response, '416 RANGE NOT SATISFIABLE', b'',
+                          [('Content-Range', f'bytes */{size}')])
+
+        start, stop = byte_range or (0, size)
+        length = stop - start
+        status = '200 OK'
+        if byte_range:
+            status = '206 PARTIAL CONTENT'
+            headers.append(('Content-Range', f'bytes {start}-{stop - 1}/{size}'))
+        headers.append(('Content-Length', str(length)))
+        start_response(status, headers)
+
+        if method == 'HEAD':
+            return []
+        if hot:
+            data = self._hot_bytes(full_path, etag)
+            return [data[start:stop]]
+
+        handle = open(full_path, 'rb')
+        if byte_range:
+            return RangeFileIterator(handle, start, length)
+        file_wrapper = environ.get('wsgi.file_wrapper', FileWrapper)
+        return file_wrapper(handle, CHUNK_SIZE)
+
+    def _hot_bytes(self, full_path, etag):
+        """Return file contents from the hot set, loading them on a miss"""
+        key = (full_path, etag)
+        data = self.hot_cache.get(key)
+        if data is None:
+            with open(full_path, 'rb') as handle:
+                data = handle.read()
+            self.hot_cache.set(key, data)
+        return data
+
+    @staticmethod
+    def _requested_range(environ, etag, last_modified, size):
+        """
+        Resolve the Range header against the file
+
+        Returns:
+            (start, stop) tuple, None to send the whole file, or
+            'unsatisfiable' when the range lies outside the file
+        """
+        header = environ.get('HTTP_RANGE')
+        if not header:
+            return None
+        if_range = environ.get('HTTP_IF_RANGE')
+        if if_range:
+            if if_range.startswith(('"', 'W/')):
+                if if_range.startswith('W/') or unquote_etag(if_range)[0] != etag:
+                    return None
+            elif parse_date(if_range) != last_modified:
+                return None
+        parsed = parse_range_header(header)
+        if parsed is None or len(parsed.ranges) != 1:
+            return None
+        resolved = parsed.range_for_length(size)
+        if resolved is None:
+            return 'unsatisfiable'
+        return resolved
+
+
+class RangeFileIterator:
+    """Stream ``length`` bytes of an open file starting at ``start``"""
+
+    def __init__(self, handle, start, length):
+        self.handle = handle
+        self.remaining = length
+        handle.seek(start)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.remaining <= 0:
+            raise StopIteration
+        chunk = self.handle.read(min(CHUNK_SIZE, self.remaining))
+        if not chunk:
+            raise StopIteration
+        self.remaining -= len(chunk)
+        return chunk
+
+    def close(self):
+        """Close the underlying file"""
+        self.handle.close()
+
+
+def _content_type(path):
+    """Guess the Content-Type header for a file"""
+    mimetype, _ = mimetypes.guess_type(path)
+    mimetype = mimetype or 'application/octet-stream'
+    if mimetype.startswith('text/') or mimetype in ('application/javascript',
+                                                    'application/json'):
+        mimetype += '; charset=utf-8'
+    return mimetype
+
+
+def _plain(start_response, status, body, extra_headers=()):
+    """Send a short plain-text response"""
+    headers = [('Content-Type', 'text/plain; charset=utf-8'),
+               ('Content-Length', str(len(body)))]
+    start_response(status, headers + list(extra_headers))
+    return [body]
+
+
+def init_static_files(app):
+    """
+    Mount the static file middleware in front of the application
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get('STATIC_MIDDLEWARE_ENABLED', True) or not app.static_folder:
+        return
+    app.wsgi_app = StaticFilesMiddleware(
+        app.wsgi_app,
+        app.static_folder,
+        url_prefix=app.static_url_path,
+        max_age=app.config.get('STATIC_CACHE_MAX_AGE', 3600),
+        hot_file_max_bytes=app.config.get('STATIC_HOT_FILE_MAX_BYTES', 256 * 1024),
+        hot_cache_bytes=app.config.get('STATIC_HOT_CACHE_BYTES', 8 * 1024 * 1024),
+        accel_prefix=app.config.get('STATIC_ACCEL_REDIRECT_PREFIX'),
+        accel_header=app.config.get('STATIC_ACCEL_REDIRECT_HEADER', 'X-Accel-Redirect')
+    )
@@ -1,6 +1,19 @@
 """Pytest configuration and fixtures"""
 import pytest
 from app import create_app
+from app.config import Config
+
+
+@pytest.fixture(autouse=True)
+def isolated_instance_files(tmp_path, monkeypatch):
+    """
+    Keep analytics and resume exports out of the real instance folder
+    
+    Applies to every configuration, including development apps built
+    directly in tests.
+    """
+    monkeypatch.setattr(Config, 'ANALYTICS_DB_PATH', str(tmp_path / 'analytics.sqlite3'))
+    monkeypatch.setattr(Config, 'RESUME_EXPORT_DIR', str(tmp_path / 'exports'))
 
 
 @pytest.fixture
@@ -0,0 +1,165 @@
+"""Tests for page-view analytics"""
+import sqlite3
+import time
+from datetime import date
+import pytest
+from app.utils.analytics import PageViewAnalytics, referrer_host
+
+
+@pytest.fixture
+def tracker(app, tmp_path):
+    """Analytics tracker writing to a temporary database"""
+    analytics = app.extensions['analytics']
+    analytics.db_path = str(tmp_path / 'data' / 'analytics.sqlite3')
+    return analytics
+
+
+@pytest.fixture
+def admin_headers(app):
+    """Authorization headers for the admin endpoints"""
+    app.config['ADMIN_TOKEN'] = 'secret'
+    return {'Authorization': 'Bearer secret'}
+
+
+class TestPageViewAnalytics:
+    """Test in-memory counting and flushing"""
+    
+    def test_record_is_in_memory(self, tmp_path):
+        """Test that recording does not touch the database"""
+        analytics = PageViewAnalytics(str(tmp_path / 'a.sqlite3'), flush_interval=0)
+        analytics.record('default', 'main.index')
+        analytics.record('default', 'main.index')
+        assert analytics.pending() == 1
+        assert not (tmp_path / 'a.sqlite3').exists()
+    
+    def test_flush_upserts_deltas(self, tmp_path):
+        """Test that repeated flushes add to existing rows"""
+        path = str(tmp_path / 'a.sqlite3')
+        analytics = PageViewAnalytics(path, flush_interval=0)
+        day = date(2025, 1, 2)
+        analytics.record('default', 'projects.detail', 'module14', 'google.com', day=day)
+        analytics.record('default', 'projects.detail', 'module14', 'google.com', day=day)
+        assert analytics.flush() == 1
+        analytics.record('default', 'projects.detail', 'module14', 'google.com', day=day)
+        analytics.flush()
+        assert analytics.flush() == 0
+        with sqlite3.connect(path) as conn:
+            rows = conn.execute('SELECT * FROM page_views').fetchall()
+            mode = conn.execute('PRAGMA journal_mode').fetchone()[0]
+        assert rows == [('2025-01-02', 'default', 'projects.detail', 'module14', 'google.com', 3)]
+        assert mode == 'wal'
+    
+    def test_failed_flush_keeps_deltas(self, tmp_path):
+        """Test that counters survive a database error"""
+        analytics = PageViewAnalytics(str(tmp_path), flush_interval=0)
+        analytics.record('default', 'main.index')
+        with pytest.raises(sqlite3.Error):
+            analytics.flush()
+        assert analytics.pending() == 1
+    
+    def test_background_flush(self, tmp_path):
+        """Test that the worker thread flushes periodically"""
+        analytics = PageViewAnalytics(str(tmp_path / 'a.sqlite3'), flush_interval=0.01)
+        analytics.record('default', 'main.index')
+        deadline = time.time() + 5
+        while analytics.pending() and time.time() < deadline:
+            time.sleep(0.01)
+        analytics.stop()
+        assert analytics.report()['total'] == 1
+    
+    def test_background_flush_survives_errors(self, tmp_path):
+        """Test that database errors do not kill the worker thread"""
+        analytics = PageViewAnalytics(str(tmp_path), flush_interval=0.01)
+        analytics.record('default', 'main.index')
+        time.sleep(0.05)
+        assert analytics._thread.is_alive()
+        analytics.db_path = str(tmp_path / 'a.sqlite3')
+        analytics.stop()
+        assert analytics.pending() == 0
+    
+    def test_report(self, tmp_path):
+        """Test report totals and filters"""
+        analytics = PageViewAnalytics(str(tmp_path / 'a.sqlite3'), flush_interval=0)
+        analytics.record('default', 'projects.detail', 'module14', 'google.com')
+        analytics.record('default', 'projects.detail', 'module14')
+        analytics.record('default', 'main.index')
+        analytics.record('other', 'main.index')
+        analytics.record('default', 'main.index', day=date(2000, 1, 1))
+        analytics.flush()
+        report = analytics.report(site='default')
+        assert report['total'] == 3
+        assert report['endpoints'][0] == {'endpoint': 'projects.detail', 'views': 2}
+        assert report['projects'] == [{'project_id': 'module14', 'views': 2}]
+        assert report['referrers'] == [{'referrer_host': 'google.com', 'views': 1}]
+        assert len(report['days']) == 1
+        assert analytics.report()['total'] == 4
+    
+    def test_referrer_hosts_capped(self, tmp_path):
+        """Test that referrer hosts beyond the limit are folded into 'other'"""
+        analytics = PageViewAnalytics(str(tmp_path / 'a.sqlite3'), flush_interval=0,
+                                      max_referrers=2)
+        for host in ('a.com', 'b.com', 'c.com', 'd.com', 'a.com'):
+            analytics.record('default', 'main.index', referrer=host)
+        analytics.flush()
+        referrers = {row['referrer_host']: row['views'] for row in analytics.report()['referrers']}
+        assert referrers == {'a.com': 2, 'b.com': 1, 'other': 2}
+        # The limit applies per flush interval
+        analytics.record('default', 'main.index', referrer='e.com')
+        analytics.flush()
+        assert 'e.com' in {row['referrer_host'] for row in analytics.report()['referrers']}
+    
+    def test_referrer_host(self):
+        """Test that referrers are reduced to external hosts"""
+        assert referrer_host('https://www.google.com/search?q=x', 'localhost') == 'www.google.com'
+        assert referrer_host('http://localhost/projects/', 'localhost:5000') is None
+        assert referrer_host('', 'localhost') is None
+        assert referrer_host('not a url', 'localhost') is None
+
+
+class TestAnalyticsIntegration:
+    """Test request recording and the admin report"""
+    
+    def test_page_views_recorded(self, client, tracker):
+        """Test that successful page views are counted per project"""
+        client.get('/projects/module14', headers={'Referer': 'https://news.ycombinator.com/item'})
+        client.get('/projects/module14')
+        client.get('/static/css/main.css')
+        client.get('/api/v1/projects')
+        client.post('/contact/', data={})
+        tracker.flush()
+        report = tracker.report()
+        assert report['total'] == 2
+        assert report['projects'] == [{'project_id': 'module14', 'views': 2}]
+        assert report['referrers'][0]['referrer_host'] == 'news.ycombinator.com'
+    
+    def test_partial_grid_requests_not_counted(self, client, tracker):
+        """Test that filter clicks swapping the grid are not page views"""
+        client.get('/projects/')
+        client.get('/projects/?category=backend', headers={'HX-Request': 'true'})
+        client.get('/projects/?category=frontend&partial=grid')
+        tracker.flush()
+        assert tracker.report()['total'] == 1
+    
+    def test_admin_disabled_without_token(self, client):
+        """Test that the admin section is hidden by default"""
+        assert client.get('/admin/analytics').status_code == 404
+    
+    def test_admin_requires_token(self, client, admin_headers):
+        """Test that a wrong token is rejected"""
+        response = client.get('/admin/analytics', headers={'Authorization': 'Bearer nope'})
+        assert response.status_code == 401
+    
+    def test_admin_report(self, client, tracker, admin_headers):
+        """Test the JSON report endpoint"""
+        client.get('/projects/therapy-app')
+        tracker.flush()
+        response = client.get('/admin/analytics?days=7', headers=admin_headers)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['total'] == 1
+        assert data['projects'][0]['project_id'] == 'therapy-app'
+    
+    def test_admin_report_without_analytics(self, app, client, admin_headers):
+        """Test the report when analytics are disabled"""
+        del app.extensions['analytics']
+        assert client.get('/admin/analytics', headers=admin_headers).status_code == 404
@@ -0,0 +1,148 @@
+"""Tests for the JSON API"""
+import gzip
+import json
+import pytest
+from app.utils import serialization
+
+
+class TestApiResources:
+    """Test API resource payloads"""
+    
+    def test_api_index(self, client):
+        """Test that the root lists every resource"""
+        response = client.get('/api/v1/')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        data = response.get_json()['data']
+        assert data['projects'] == '/api/v1/projects'
+        assert set(data) == {'skills', 'experience', 'technologies', 'projects'}
+    
+    def test_skills(self, client):
+        """Test that skills are grouped by section"""
+        data = client.get('/api/v1/skills').get_json()['data']
+        assert data['business'][0]['name'] == 'Business Analysis'
+        assert any(skill['name'] == 'Python' for skill in data['developer'])
+    
+    def test_experience(self, client):
+        """Test the experience resource"""
+        data = client.get('/api/v1/experience').get_json()['data']
+        assert data[0]['company'] == 'Tech Solutions Inc.'
+    
+    def test_technologies(self, client):
+        """Test the technologies resource"""
+        data = client.get('/api/v1/technologies').get_json()['data']
+        assert 'Flask' in data['Frameworks']
+    
+    def test_projects(self, client):
+        """Test the projects collection"""
+        payload = client.get('/api/v1/projects').get_json()
+        assert payload['version']
+        ids = [project['id'] for project in payload['data']]
+        assert ids == ['therapy-app', 'module14', 'portfolio']
+    
+    def test_project_detail(self, client):
+        """Test a single project"""
+        data = client.get('/api/v1/projects/module14').get_json()['data']
+        assert data['title'] == 'FastAPI Calculator with JWT Auth'
+    
+    def test_unknown_project(self, client):
+        """Test that unknown projects return a JSON 404"""
+        response = client.get('/api/v1/projects/nope')
+        assert response.status_code == 404
+        assert response.get_json() == {'error': 'Not found'}
+    
+    def test_unknown_api_path_returns_json(self, app, client):
+        """Test that unrouted API paths get the JSON error, never the HTML page"""
+        for _ in range(4):
+            response = client.get('/api/v1/nope')
+            assert response.status_code == 404
+            assert response.mimetype == 'application/json'
+            assert response.get_json() == {'error': 'Not found'}
+        assert app.extensions['error_pages'].misses('localhost', '/api/v1/nope') == 0
+
+
+class TestApiFieldSelection:
+    """Test ?fields= filtering"""
+    
+    def test_fields_on_collection(self, client):
+        """Test that only requested fields are returned"""
+        data = client.get('/api/v1/projects?fields=id, title').get_json()['data']
+        assert data[0] == {'id': 'therapy-app', 'title': 'AI Therapy Application'}
+    
+    def test_fields_on_grouped_collection(self, client):
+        """Test that grouped lists are filtered item by item"""
+        data = client.get('/api/v1/skills?fields=name').get_json()['data']
+        assert data['business'][0] == {'name': 'Business Analysis'}
+    
+    def test_fields_on_single_record(self, client):
+        """Test that a single record is filtered"""
+        data = client.get('/api/v1/projects/portfolio?fields=id').get_json()['data']
+        assert data == {'id': 'portfolio'}
+    
+    def test_fields_leave_plain_values(self, client):
+        """Test that lists of plain values are untouched"""
+        data = client.get('/api/v1/technologies?fields=name').get_json()['data']
+        assert 'Python' in data['Languages']
+
+
+class TestApiCaching:
+    """Test cached payloads, ETags and compression"""
+    
+    def test_payload_cached_per_version(self, app, client):
+        """Test that repeat requests reuse the serialized bytes"""
+        cache = app.extensions['api_cache']
+        client.get('/api/v1/projects')
+        client.get('/api/v1/projects')
+        assert cache.hits == 1
+    
+    def test_unknown_fields_share_entry(self, app, client):
+        """Test that unknown field names do not create cache entries"""
+        cache = app.extensions['api_cache']
+        client.get('/api/v1/projects?fields=id')
+        for junk in ('id,x1', 'id,x2', 'x3,id'):
+            data = client.get(f'/api/v1/projects?fields={junk}').get_json()['data']
+            assert data[0] == {'id': 'therapy-app'}
+        assert len(cache) == 1
+    
+    def test_payloads_do_not_use_page_cache(self, app, client):
+        """Test that API payloads never evict rendered pages"""
+        client.get('/api/v1/projects?fields=title')
+        assert len(app.extensions['sites'].default.page_cache) == 0
+    
+    def test_etag_not_modified(self, client):
+        """Test that If-None-Match returns 304"""
+        response = client.get('/api/v1/skills')
+        assert response.headers['Cache-Control']
+        assert response.headers['Access-Control-Allow-Origin'] == '*'
+        etag = response.headers['ETag']
+        cached = client.get('/api/v1/skills', headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+        assert cached.data == b''
+    
+    def test_gzip(self, client):
+        """Test that large payloads are sent gzipped when accepted"""
+        plain = client.get('/api/v1/projects')
+        response = client.get('/api/v1/projects', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert response.headers['ETag'] != plain.headers['ETag']
+        assert gzip.decompress(response.data) == plain.data
+    
+    def test_small_payload_not_gzipped(self, client):
+        """Test that tiny payloads skip compression"""
+        response = client.get('/api/v1/projects/portfolio?fields=id',
+                              headers={'Accept-Encoding': 'gzip'})
+        assert 'Content-Encoding' not in response.headers
+
+
+class TestSerialization:
+    """Test the JSON serializer"""
+    
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test compact output without orjson"""
+        monkeypatch.setattr(serialization, 'orjson', None)
+        assert serialization.dumps({'a': [1, 'é']}) == '{"a":[1,"é"]}'.encode('utf-8')
+    
+    def test_output_is_valid_json(self):
+        """Test that the active serializer produces parseable JSON"""
+        assert json.loads(serialization.dumps({'a': 1})) == {'a': 1}
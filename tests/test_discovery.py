@@ -0,0 +1,148 @@
+"""Tests for sitemap.xml, robots.txt, the projects feed and URL enumeration"""
+import gzip
+from xml.etree import ElementTree
+
+from app.utils.site_urls import site_urls
+
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+
+class TestSiteUrls:
+    """Test URL enumeration from the URL map"""
+    
+    def test_lists_pages_and_projects(self, app):
+        """Test that static pages and every project detail page are listed"""
+        site = app.extensions['sites'].default
+        paths = [url.path for url in site_urls(app, site)]
+        assert '/' in paths
+        assert '/business/resume' in paths
+        assert '/contact/' in paths
+        for project in site.projects:
+            assert f"/projects/{project['id']}" in paths
+    
+    def test_excludes_private_routes(self, app):
+        """Test that API, admin, static, export and discovery routes are left out"""
+        site = app.extensions['sites'].default
+        endpoints = {url.endpoint for url in site_urls(app, site)}
+        assert not any(endpoint.startswith(('api.', 'admin.', 'discovery.'))
+                       for endpoint in endpoints)
+        assert 'static' not in endpoints
+        assert 'business.resume_export' not in endpoints
+        assert 'business.resume_file' not in endpoints
+        assert 'main.about' not in endpoints
+
+
+class TestSitemap:
+    """Test sitemap.xml"""
+    
+    def test_sitemap(self, app, client):
+        """Test that the sitemap lists absolute URLs with lastmod"""
+        response = client.get('/sitemap.xml')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/xml'
+        root = ElementTree.fromstring(response.data)
+        locs = [url.find(f'{SITEMAP_NS}loc').text for url in root]
+        assert 'https://theratoast.com/projects/therapy-app' in locs
+        assert not any('/api/' in loc for loc in locs)
+        lastmod = app.extensions['sites'].default.content_modified.date().isoformat()
+        assert root[0].find(f'{SITEMAP_NS}lastmod').text == lastmod
+    
+    def test_built_once_per_version(self, app, client, monkeypatch):
+        """Test that the sitemap is served from the cache after the first request"""
+        from app.routes import discovery
+        calls = []
+        original = discovery.site_urls
+        monkeypatch.setattr(discovery, 'site_urls', lambda *args: calls.append(1) or original(*args))
+        first = client.get('/sitemap.xml')
+        second = client.get('/sitemap.xml')
+        assert first.data == second.data
+        assert len(calls) == 1
+    
+    def test_rebuilt_on_content_change(self, app, client):
+        """Test that a new content version produces a new ETag"""
+        etag = client.get('/sitemap.xml').headers['ETag']
+        site = app.extensions['sites'].default
+        site.content['projects']['items'].append(dict(site.projects[0], id='new-project'))
+        site._snapshot = site.snapshot._replace(version='changed')
+        response = client.get('/sitemap.xml')
+        assert b'/projects/new-project' in response.data
+        assert response.headers['ETag'] != etag
+    
+    def test_absolute_urls_ignore_request_host(self, app, client):
+        """Test that spoofed hosts neither leak into URLs nor add cache entries"""
+        cache = app.extensions['discovery_cache']
+        for host in ('evil.example.com', 'other.example.com', 'localhost'):
+            response = client.get('/sitemap.xml', headers={'Host': host})
+            assert b'https://theratoast.com/projects/' in response.data
+            assert host.encode() not in response.data
+        assert len(cache) == 1
+
+
+    def test_documents_kept_apart_from_pages(self, app, client):
+        """Test that documents survive page-cache pressure and never evict pages"""
+        site = app.extensions['sites'].default
+        client.get('/sitemap.xml')
+        assert len(site.page_cache) == 0
+        site.page_cache.clear()
+        client.get('/sitemap.xml')
+        assert app.extensions['discovery_cache'].hits == 1
+
+
+class TestRobots:
+    """Test robots.txt"""
+    
+    def test_robots(self, client):
+        """Test that robots.txt disallows private sections and links the sitemap"""
+        response = client.get('/robots.txt')
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        lines = response.data.decode().splitlines()
+        assert 'Disallow: /api/v1/' in lines
+        assert 'Disallow: /admin/' in lines
+        assert 'Sitemap: https://theratoast.com/sitemap.xml' in lines
+
+
+class TestFeed:
+    """Test the Atom feed"""
+    
+    def test_feed_lists_projects(self, app, client):
+        """Test that every project has an entry"""
+        response = client.get('/feed.xml')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/atom+xml'
+        root = ElementTree.fromstring(response.data)
+        entries = root.findall(f'{ATOM_NS}entry')
+        assert len(entries) == len(app.extensions['sites'].default.projects)
+        assert entries[0].find(f'{ATOM_NS}title').text == 'AI Therapy Application'
+    
+    def test_feed_linked_from_pages(self, client):
+        """Test that pages advertise the feed"""
+        response = client.get('/')
+        assert b'application/atom+xml' in response.data
+        assert b'/feed.xml' in response.data
+
+
+class TestCaching:
+    """Test conditional and compressed responses"""
+    
+    def test_etag_not_modified(self, client):
+        """Test that a matching If-None-Match returns 304"""
+        etag = client.get('/feed.xml').headers['ETag']
+        response = client.get('/feed.xml', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+    
+    def test_gzip(self, client):
+        """Test that compressed bytes are served to clients accepting gzip"""
+        plain = client.get('/sitemap.xml')
+        response = client.get('/sitemap.xml', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert gzip.decompress(response.data) == plain.data
+        assert response.headers['ETag'] != plain.headers['ETag']
+    
+    def test_not_counted_as_page_views(self, app, client):
+        """Test that crawler documents are excluded from analytics"""
+        client.get('/sitemap.xml')
+        assert app.extensions['analytics'].pending() == 0
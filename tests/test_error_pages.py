@@ -0,0 +1,155 @@
+"""Tests for branded, cached error pages"""
+import os
+import pytest
+from app.utils.error_pages import ErrorPages
+
+
+@pytest.fixture
+def error_pages(app):
+    """Error page cache of the test application"""
+    return app.extensions['error_pages']
+
+
+class TestErrorPages:
+    """Test error responses"""
+    
+    def test_404_uses_site_layout(self, client):
+        """Test that 404 pages are rendered with navigation and footer"""
+        response = client.get('/nonexistent-page')
+        assert response.status_code == 404
+        assert response.mimetype == 'text/html'
+        assert b'<nav' in response.data
+        assert b'<footer' in response.data
+        assert b'Page not found | Joshua Nizamudin' in response.data
+        assert 'max-age=300' in response.headers['Cache-Control']
+    
+    def test_404_rendered_once(self, client, error_pages):
+        """Test that later 404s are served from memory"""
+        client.get('/missing-one')
+        client.get('/missing-two')
+        assert len(error_pages.pages) == 1
+        assert error_pages.pages.hits == 1
+    
+    def test_retired_project_returns_410(self, app, client):
+        """Test that retired projects answer 410 Gone"""
+        site = app.extensions['sites'].default
+        site.content['projects']['retired'] = ['old-project']
+        response = client.get('/projects/old-project')
+        assert response.status_code == 410
+        assert b'Page removed' in response.data
+    
+    def test_500_page(self, app, client):
+        """Test that unhandled errors render the branded 500 page"""
+        app.config['PROPAGATE_EXCEPTIONS'] = False
+        
+        @app.route('/boom')
+        def boom():
+            raise RuntimeError('boom')
+        
+        response = client.get('/boom')
+        assert response.status_code == 500
+        assert b'Internal server error' in response.data
+        assert b'<nav' in response.data
+        assert response.headers['Cache-Control'] == 'no-store'
+    
+    def test_broken_template_falls_back_to_text(self, app, client, error_pages, monkeypatch):
+        """Test that a failing render still produces a plain response"""
+        def broken(site, status):
+            raise RuntimeError('template error')
+        monkeypatch.setattr(error_pages, 'page', broken)
+        response = client.get('/nonexistent-page')
+        assert response.status_code == 404
+        assert response.data == b'Page not found'
+        assert response.mimetype == 'text/plain'
+
+
+class TestMissTracking:
+    """Test per-path miss counters and the dead-path fast path"""
+    
+    def test_misses_counted_per_path(self, client, error_pages):
+        """Test that misses are tracked per host and path"""
+        client.get('/wp-login.php')
+        client.get('/wp-login.php')
+        client.get('/projects/nope')
+        assert error_pages.misses('localhost', '/wp-login.php') == 2
+        assert error_pages.misses('localhost', '/projects/nope') == 1
+    
+    def test_fast_path_skips_flask(self, app, client, error_pages):
+        """Test that hammered dead URLs are answered before Flask"""
+        seen = []
+        app.before_request(lambda: seen.append(1))
+        for _ in range(3):
+            client.get('/wp-login.php')
+        assert len(seen) == 3
+        response = client.get('/wp-login.php')
+        assert response.status_code == 404
+        assert b'Page not found' in response.data
+        assert len(seen) == 3
+        head = client.head('/wp-login.php')
+        assert head.status_code == 404
+        assert head.data == b''
+        assert len(seen) == 3
+    
+    def test_fast_path_non_ascii_paths(self, app, client):
+        """Test that encoded junk paths reach the fast path too"""
+        seen = []
+        app.before_request(lambda: seen.append(1))
+        for path in ('/projects/%ff', '/projects/caf%C3%A9', '/%E2%9C%93'):
+            seen.clear()
+            for _ in range(6):
+                assert client.get(path).status_code == 404
+            assert len(seen) == 3
+    
+    def test_fast_path_keeps_410(self, app, client):
+        """Test that the fast path preserves the original status"""
+        app.extensions['sites'].default.content['projects']['retired'] = ['old']
+        for _ in range(4):
+            response = client.get('/projects/old')
+        assert response.status_code == 410
+    
+    def test_fast_path_resets_on_content_change(self, app, client, error_pages):
+        """Test that a new content version re-checks dead URLs"""
+        site = app.extensions['sites'].default
+        for _ in range(3):
+            client.get('/missing')
+        site._snapshot = site.snapshot._replace(version='changed')
+        assert error_pages.fast_path('localhost', '/missing') is None
+        client.get('/missing')
+        assert error_pages.misses('localhost', '/missing') == 1
+    
+    def test_tracked_paths_bounded(self, app):
+        """Test that only the most recent missed URLs are remembered"""
+        pages = ErrorPages(app.extensions['sites'], max_tracked_paths=2)
+        site = app.extensions['sites'].default
+        for path in ('/a', '/b', '/c'):
+            pages.record_miss('localhost', path, site)
+        assert pages.misses('localhost', '/a') == 0
+        assert pages.misses('localhost', '/c') == 1
+    
+    def test_fast_path_requires_rendered_page(self, app):
+        """Test that nothing is served before the page has been rendered"""
+        pages = ErrorPages(app.extensions['sites'], fast_path_threshold=1)
+        pages.record_miss('localhost', '/x', app.extensions['sites'].default)
+        assert pages.fast_path('localhost', '/x') is None
+    
+    def test_404_that_becomes_valid(self, app, client, error_pages, tmp_path):
+        """Test that a 404 depending on worker state is never fast-pathed"""
+        exporter = app.extensions['resume_export']
+        exporter.export_dir = str(tmp_path)
+        site = app.extensions['sites'].default
+        artifact = exporter.build(site)['pdf']
+        url = f'/business/resume/files/{artifact.filename}'
+        # Start over as if no worker had built the export yet
+        exporter._artifacts.clear()
+        os.remove(artifact.path)
+        for _ in range(4):
+            assert client.get(url).status_code == 404
+        assert error_pages.misses('localhost', url) == 0
+        exporter.build(site)
+        assert client.get(url).status_code == 200
+    
+    def test_admin_404_not_tracked(self, client, error_pages):
+        """Test that the hidden admin section is not remembered as dead"""
+        for _ in range(4):
+            assert client.get('/admin/analytics').status_code == 404
+        assert error_pages.misses('localhost', '/admin/analytics') == 0
@@ -0,0 +1,147 @@
+"""Tests for the LRU byte cache and Jinja fragment caching"""
+import pytest
+from app import create_app
+from app.utils.cache import LRUByteCache, byte_size
+
+
+class TestLRUByteCache:
+    """Test the byte-bounded LRU cache"""
+    
+    def test_set_and_get(self):
+        """Test that stored values can be read back"""
+        cache = LRUByteCache(100)
+        assert cache.set('a', 'hello')
+        assert cache.get('a') == 'hello'
+        assert 'a' in cache
+        assert len(cache) == 1
+    
+    def test_byte_accounting(self):
+        """Test that sizes are counted in encoded bytes"""
+        cache = LRUByteCache(100)
+        cache.set('a', 'é')
+        cache.set('b', b'xyz')
+        assert cache.current_bytes == 5
+        cache.set('a', 'ab')
+        assert cache.current_bytes == 5
+        assert byte_size(123) == 3
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first"""
+        cache = LRUByteCache(10)
+        cache.set('a', '1234')
+        cache.set('b', '1234')
+        cache.get('a')
+        cache.set('c', '1234')
+        assert cache.get('b') is None
+        assert cache.get('a') == '1234'
+        assert cache.current_bytes <= 10
+    
+    def test_oversized_value_not_stored(self):
+        """Test that values larger than the budget are rejected"""
+        cache = LRUByteCache(4)
+        assert not cache.set('a', '12345')
+        assert cache.get('a') is None
+        assert cache.current_bytes == 0
+    
+    def test_expiry(self, monkeypatch):
+        """Test that entries expire after their timeout"""
+        import app.utils.cache as cache_module
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now[0])
+        cache = LRUByteCache(100, default_timeout=10)
+        cache.set('a', 'x')
+        cache.set('b', 'y', timeout=100)
+        now[0] += 11
+        assert cache.get('a') is None
+        assert cache.get('b') == 'y'
+    
+    def test_delete_clear_and_stats(self):
+        """Test removal helpers and usage statistics"""
+        cache = LRUByteCache(100)
+        cache.set('a', 'x')
+        cache.set('b', 'y')
+        cache.delete('a')
+        cache.delete('missing')
+        assert cache.get('a') is None
+        assert cache.get('b') == 'y'
+        stats = cache.stats()
+        assert stats['entries'] == 1
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.current_bytes == 0
+
+
+class TestFragmentCache:
+    """Test the {% cache %} template tag"""
+    
+    def test_extension_registered(self, app):
+        """Test that create_app wires up the fragment cache"""
+        assert app.jinja_env.fragment_cache is not None
+        assert app.extensions['fragment_cache'] is app.jinja_env.fragment_cache
+    
+    def test_fragment_rendered_once(self, app):
+        """Test that a cached block is only rendered on the first call"""
+        calls = []
+        template = app.jinja_env.from_string(
+            "{% cache 'counter' %}{{ tick() }}{% endcache %}"
+        )
+        tick = lambda: calls.append(1) or len(calls)
+        with app.test_request_context('/'):
+            assert template.render(tick=tick) == '1'
+            assert template.render(tick=tick) == '1'
+        assert len(calls) == 1
+    
+    def test_fragment_key_includes_arguments(self, app):
+        """Test that different key values produce separate entries"""
+        template = app.jinja_env.from_string(
+            "{% cache ('item', value) %}{{ value }}{% endcache %}"
+        )
+        with app.test_request_context('/'):
+            assert template.render(value='a') == 'a'
+            assert template.render(value='b') == 'b'
+    
+    def test_fragment_key_includes_endpoint(self, app):
+        """Test that blocks are cached per active endpoint"""
+        template = app.jinja_env.from_string(
+            "{% cache 'nav' %}{{ request.endpoint }}{% endcache %}"
+        )
+        with app.test_request_context('/'):
+            assert template.render() == 'main.index'
+        with app.test_request_context('/business/'):
+            assert template.render() == 'business.index'
+    
+    def test_fragment_with_timeout(self, app):
+        """Test that a TTL argument is accepted"""
+        template = app.jinja_env.from_string(
+            "{% cache 'ttl', 60 %}<b>{{ value }}</b>{% endcache %}"
+        )
+        with app.test_request_context('/'):
+            assert template.render(value='x') == '<b>x</b>'
+            assert template.render(value='y') == '<b>x</b>'
+    
+    def test_fragment_outside_request(self, app):
+        """Test that blocks render without a request context"""
+        template = app.jinja_env.from_string(
+            "{% cache 'plain' %}ok{% endcache %}"
+        )
+        assert template.render() == 'ok'
+    
+    def test_cached_output_not_escaped(self, app, client):
+        """Test that cached HTML is emitted as markup on repeat requests"""
+        client.get('/contact/')
+        response = client.get('/contact/')
+        assert b'<nav' in response.data
+        assert b'&lt;nav' not in response.data
+        assert app.jinja_env.fragment_cache.hits > 0
+    
+    def test_disabled_cache_renders_every_time(self):
+        """Test that blocks are re-rendered when caching is disabled"""
+        app = create_app('development')
+        assert app.jinja_env.fragment_cache is None
+        template = app.jinja_env.from_string(
+            "{% cache 'x' %}{{ value }}{% endcache %}"
+        )
+        assert template.render(value='a') == 'a'
+        assert template.render(value='b') == 'b'
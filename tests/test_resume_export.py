@@ -0,0 +1,251 @@
+"""Tests for the resume export pipeline"""
+import json
+import os
+import re
+import time
+import zlib
+import pytest
+from app.utils.pdf import PDFDocument, escape, wrap
+from app import create_app
+from app.utils.resume_export import ResumeExporter, build_resume
+
+
+@pytest.fixture
+def exporter(app, tmp_path):
+    """Resume exporter writing to a temporary directory"""
+    resume_export = app.extensions['resume_export']
+    resume_export.export_dir = str(tmp_path / 'exports')
+    return resume_export
+
+
+@pytest.fixture
+def site_copy(app, tmp_path):
+    """Default site pointed at a writable copy of its content"""
+    site = app.extensions['sites'].default
+    path = tmp_path / 'default.json'
+    with open(site.content_path, 'rb') as handle:
+        path.write_bytes(handle.read())
+    site.content_path = str(path)
+    site.reload()
+    return site
+
+
+class TestPDFDocument:
+    """Test the minimal PDF writer"""
+    
+    def test_render_structure(self):
+        """Test that the output is a well-formed PDF"""
+        doc = PDFDocument()
+        doc.text('Hello (world)', size=14, bold=True, align='center')
+        doc.rule()
+        data = doc.render()
+        assert data.startswith(b'%PDF-1.4')
+        assert data.endswith(b'%%EOF\n')
+        startxref = int(re.search(rb'startxref\n(\d+)', data).group(1))
+        assert data[startxref:].startswith(b'xref')
+        first_offset = int(re.findall(rb'(\d{10}) 00000 n', data)[0])
+        assert data[first_offset:].startswith(b'1 0 obj')
+    
+    def test_text_is_escaped_and_compressed(self):
+        """Test that page content is deflated and escaped"""
+        doc = PDFDocument()
+        doc.text('Hello (world)')
+        data = doc.render()
+        stream = re.search(rb'stream\n(.*?)\nendstream', data, re.S).group(1)
+        assert b'(Hello \\(world\\)) Tj' in zlib.decompress(stream)
+    
+    def test_page_breaks(self):
+        """Test that long content flows onto new pages"""
+        doc = PDFDocument()
+        for _ in range(80):
+            doc.text('Line of text')
+            doc.rule()
+        assert len(doc.pages) > 1
+        assert b'/Count %d' % len(doc.pages) in doc.render()
+    
+    def test_deterministic(self):
+        """Test that identical input yields identical bytes"""
+        def render():
+            doc = PDFDocument()
+            doc.text('Same')
+            return doc.render()
+        assert render() == render()
+    
+    def test_wrap(self):
+        """Test word wrapping and splitting of long words"""
+        lines = wrap('aaa bbb ccc ' + 'x' * 30, width=52, size=10)
+        assert lines[0] == 'aaa bbb'
+        assert all(len(line) <= 10 for line in lines)
+        assert wrap('', width=100, size=10) == ['']
+        assert escape('a\\b') == 'a\\\\b'
+
+
+class TestResumeExporter:
+    """Test building, storing and refreshing exports"""
+    
+    def test_build_resume_data(self, app):
+        """Test that resume data comes from the business content"""
+        resume = build_resume(app.extensions['sites'].default)
+        assert resume['name'] == 'Joshua Nizamudin'
+        assert 'Business Analysis' in resume['business_skills']
+        assert resume['experience'][0]['highlights']
+        assert resume['projects'][0]['id'] == 'therapy-app'
+    
+    def test_get_queues_build(self, app, exporter):
+        """Test that a missing export is queued, not built inline"""
+        site = app.extensions['sites'].default
+        assert exporter.get(site, 'pdf') is None
+        assert exporter.get(site, 'pdf') is None
+        assert exporter.run_pending() == 1
+        artifact = exporter.get(site, 'pdf')
+        assert artifact.filename == f'resume-{artifact.etag}.pdf'
+        with open(artifact.path, 'rb') as handle:
+            assert handle.read().startswith(b'%PDF')
+        html = exporter.get(site, 'html')
+        with open(html.path, encoding='utf-8') as handle:
+            assert 'Tech Solutions Inc.' in handle.read()
+        assert exporter.find(site, 'resume-unknown.pdf') is None
+    
+    def test_content_change_rebuilds(self, app, exporter, site_copy):
+        """Test that changed content gets new artifacts and old ones removed"""
+        exporter.build(site_copy)
+        old = exporter.get(site_copy, 'pdf')
+        registry = app.extensions['sites']
+        assert registry.check_for_changes() == []
+        content = json.loads(open(site_copy.content_path, encoding='utf-8').read())
+        content['resume']['summary'] = 'Updated summary'
+        with open(site_copy.content_path, 'w', encoding='utf-8') as handle:
+            json.dump(content, handle)
+        os.utime(site_copy.content_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        assert registry.check_for_changes() == [site_copy.id]
+        # The previous artifact is served until the rebuild finishes
+        assert exporter.get(site_copy, 'pdf') == old
+        exporter.run_pending()
+        new = exporter.get(site_copy, 'pdf')
+        assert new.filename != old.filename
+        # Other workers may still serve the old artifact during the grace period
+        assert os.path.exists(old.path)
+        exporter.stale_grace = 0
+        exporter.build(site_copy)
+        assert not os.path.exists(old.path)
+    
+    def test_shared_directory_is_safe(self, app, exporter):
+        """Test that other workers' temporary and recent files are kept"""
+        site = app.extensions['sites'].default
+        directory = os.path.join(exporter.export_dir, site.id)
+        os.makedirs(directory)
+        in_flight = os.path.join(directory, 'resume-0123456789abcdef.pdf.999.tmp')
+        previous = os.path.join(directory, 'resume-fedcba9876543210.pdf')
+        for path in (in_flight, previous):
+            with open(path, 'wb') as handle:
+                handle.write(b'data')
+        exporter.stale_grace = 60
+        exporter.build(site)
+        assert os.path.exists(previous)
+        exporter.stale_grace = 0
+        exporter.build(site)
+        assert os.path.exists(in_flight)
+        assert not os.path.exists(previous)
+    
+    def test_failed_build_is_logged(self, app, exporter, monkeypatch):
+        """Test that build errors do not escape the worker"""
+        site = app.extensions['sites'].default
+        monkeypatch.setattr(exporter, 'build', lambda site: 1 / 0)
+        exporter.request_build(site)
+        assert exporter.run_pending() == 1
+        assert exporter.find(site, 'anything') is None
+    
+    def test_background_worker(self, app, tmp_path):
+        """Test that the worker thread builds queued sites"""
+        exporter = ResumeExporter(app, str(tmp_path), background=True)
+        site = app.extensions['sites'].default
+        exporter.get(site, 'pdf')
+        deadline = time.time() + 5
+        while exporter.get(site, 'pdf') is None and time.time() < deadline:
+            time.sleep(0.01)
+        assert exporter.get(site, 'pdf') is not None
+
+
+class TestResumeRoutes:
+    """Test the resume page and download endpoints"""
+    
+    def test_resume_page_uses_content(self, client, exporter):
+        """Test that the resume page renders the shared resume data"""
+        response = client.get('/business/resume')
+        assert b'Tech Solutions Inc.' in response.data
+        assert b'/business/resume.pdf' in response.data
+        assert exporter.run_pending() == 1
+    
+    def test_export_not_ready(self, client, exporter):
+        """Test that downloads answer 503 until the export exists"""
+        response = client.get('/business/resume.pdf')
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '5'
+    
+    def test_unknown_format(self, client):
+        """Test that unsupported formats return 404"""
+        assert client.get('/business/resume.docx').status_code == 404
+    
+    def test_download_pdf(self, client, exporter):
+        """Test redirect to the hashed file and caching headers"""
+        client.get('/business/resume.pdf')
+        exporter.run_pending()
+        response = client.get('/business/resume.pdf')
+        assert response.status_code == 302
+        assert 'no-cache' in response.headers['Cache-Control']
+        location = response.headers['Location']
+        assert re.search(r'/business/resume/files/resume-[0-9a-f]{16}\.pdf$', location)
+        pdf = client.get(location)
+        assert pdf.status_code == 200
+        assert pdf.mimetype == 'application/pdf'
+        assert pdf.data.startswith(b'%PDF')
+        assert 'immutable' in pdf.headers['Cache-Control']
+        assert 'max-age=31536000' in pdf.headers['Cache-Control']
+        cached = client.get(location, headers={'If-None-Match': pdf.headers['ETag']})
+        assert cached.status_code == 304
+        partial = client.get(location, headers={'Range': 'bytes=0-3'})
+        assert partial.status_code == 206
+        assert partial.data == b'%PDF'
+    
+    def test_download_html(self, client, exporter):
+        """Test the printable HTML export"""
+        client.get('/business/resume.html')
+        exporter.run_pending()
+        response = client.get('/business/resume.html', follow_redirects=True)
+        assert response.status_code == 200
+        assert b'@media print' in response.data
+    
+    def test_unknown_file(self, client):
+        """Test that unknown artifact names return 404"""
+        assert client.get('/business/resume/files/resume-0.pdf').status_code == 404
+    
+    def test_deleted_file(self, app, client, exporter):
+        """Test that an artifact removed from disk returns 404"""
+        site = app.extensions['sites'].default
+        exporter.build(site)
+        artifact = exporter.get(site, 'pdf')
+        os.remove(artifact.path)
+        response = client.get(f'/business/resume/files/{artifact.filename}')
+        assert response.status_code == 404
+    
+    def test_file_served_by_other_worker(self, app, client, exporter):
+        """Test that a worker serves artifacts another worker built"""
+        other = create_app('testing')
+        other_exporter = other.extensions['resume_export']
+        other_exporter.export_dir = exporter.export_dir
+        client.get('/business/resume.pdf')
+        exporter.run_pending()
+        location = client.get('/business/resume.pdf').headers['Location']
+        assert other_exporter.find(other.extensions['sites'].default, 'resume-0.pdf') is None
+        response = other.test_client().get(location)
+        assert response.status_code == 200
+        assert response.data.startswith(b'%PDF')
+        assert response.headers['ETag'] == client.get(location).headers['ETag']
+    
+    def test_invalid_file_names_rejected(self, app, exporter):
+        """Test that only content-hash names are looked up on disk"""
+        site = app.extensions['sites'].default
+        exporter.build(site)
+        for name in ('../default.json', 'resume-XYZ.pdf', 'resume-0123456789abcdef.exe'):
+            assert exporter.find(site, name) is None
+
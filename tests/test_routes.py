@@ -93,6 +93,59 @@ class TestProjectsRoutes:
         # Should show therapy app which is Full Stack
         assert b'AI Therapy Application' in response.data
     
+    def test_projects_filter_lowercase_slug(self, client):
+        """Test that the lowercase slugs used by filter links match"""
+        response = client.get('/projects/?category=full stack')
+        assert b'AI Therapy Application' in response.data
+        assert b'FastAPI Calculator' not in response.data
+    
+    def test_projects_partial_header(self, client):
+        """Test that HX-Request returns only the project grid"""
+        response = client.get('/projects/?category=backend',
+                              headers={'HX-Request': 'true'})
+        assert response.status_code == 200
+        assert b'FastAPI Calculator' in response.data
+        assert b'AI Therapy Application' not in response.data
+        assert b'<nav' not in response.data
+        assert b'Project Portfolio' not in response.data
+        assert 'HX-Request' in response.headers['Vary']
+    
+    def test_projects_partial_query(self, client):
+        """Test that ?partial=grid returns only the project grid"""
+        response = client.get('/projects/?category=frontend&partial=grid')
+        assert b'No projects found in this category.' in response.data
+        assert b'<html' not in response.data
+    
+    def test_projects_partial_cached_separately(self, client):
+        """Test that full pages and fragments do not share cache entries"""
+        client.get('/projects/?category=all', headers={'HX-Request': 'true'})
+        response = client.get('/projects/?category=all')
+        assert b'<nav' in response.data
+        assert b'id="project-grid"' in response.data
+        partial = client.get('/projects/?category=all', headers={'HX-Request': 'true'})
+        assert b'<nav' not in partial.data
+    
+    def test_projects_filter_state_follows_history(self, client):
+        """Test that the filter buttons listen for back/forward updates"""
+        response = client.get('/projects/?category=backend')
+        assert b"active: 'backend'" in response.data
+        assert b'@grid-filter.window="active = $event.detail"' in response.data
+    
+    def test_projects_category_case_shares_cache_entry(self, app, client):
+        """Test that category spellings differing only in case are cached once"""
+        cache = app.extensions['sites'].default.page_cache
+        for category in ('Backend', 'backend', 'BACKEND'):
+            response = client.get(f'/projects/?category={category}')
+            assert b'FastAPI Calculator' in response.data
+        assert len(cache) == 1
+        assert cache.hits == 2
+    
+    def test_projects_unknown_category_not_cached(self, app, client):
+        """Test that arbitrary categories are rendered but not cached"""
+        response = client.get('/projects/?category=nonsense')
+        assert response.status_code == 200
+        assert len(app.extensions['sites'].default.page_cache) == 0
+    
     def test_project_detail_route(self, client):
         """Test that project detail route works"""
         response = client.get('/projects/therapy-app')
@@ -122,11 +175,11 @@ class TestProjectsRoutes:
         assert b'100% test coverage' in response.data
     
     def test_project_detail_invalid_id(self, client):
-        """Test that invalid project ID redirects to projects page"""
+        """Test that invalid project ID returns the branded 404 page"""
         response = client.get('/projects/nonexistent-project')
-        assert response.status_code == 200
-        # Should show projects page
-        assert b'Project Portfolio' in response.data
+        assert response.status_code == 404
+        assert b'Page not found' in response.data
+        assert b'Browse Projects' in response.data
 
 
 class TestContactRoutes:
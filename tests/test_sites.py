@@ -0,0 +1,235 @@
+"""Tests for multi-site hosting"""
+import json
+import os
+import time
+import pytest
+from jinja2 import ChoiceLoader, DictLoader
+from app import create_app
+from app.utils.sites import Site, SiteRegistry, current_site
+
+
+@pytest.fixture
+def content_dir(tmp_path):
+    """Create a content directory with two sites"""
+    source = os.path.join(create_app('testing').config['CONTENT_DIR'], 'default.json')
+    with open(source, encoding='utf-8') as handle:
+        content = json.load(handle)
+    (tmp_path / 'default.json').write_text(json.dumps(content), encoding='utf-8')
+    content['profile'].update(name='Ada Lovelace', initials='AL')
+    (tmp_path / 'ada.json').write_text(json.dumps(content), encoding='utf-8')
+    (tmp_path / 'sites.json').write_text(json.dumps({
+        'default': 'default',
+        'sites': {
+            'default': {'hosts': ['localhost'], 'content': 'default.json'},
+            'ada': {'hosts': ['ada.example.com'], 'content': 'ada.json', 'theme': 'dark'}
+        }
+    }), encoding='utf-8')
+    return tmp_path
+
+
+@pytest.fixture
+def multi_app(app, content_dir):
+    """Application serving the two test sites"""
+    app.extensions['sites'] = SiteRegistry.from_file(
+        str(content_dir / 'sites.json'), str(content_dir), 1024 * 1024, 1024 * 1024
+    )
+    return app
+
+
+class TestSiteRegistry:
+    """Test host resolution and cache budgets"""
+    
+    def test_default_registry_loaded(self, app):
+        """Test that create_app loads the bundled sites.json"""
+        registry = app.extensions['sites']
+        assert registry.default.id == 'default'
+        assert registry.resolve('theratoast.com') is registry.default
+    
+    def test_resolve_ignores_port_and_case(self, multi_app):
+        """Test that hosts match regardless of port and case"""
+        registry = multi_app.extensions['sites']
+        assert registry.resolve('ADA.example.com:8000').id == 'ada'
+        assert registry.resolve('unknown.example.com').id == 'default'
+        assert registry.resolve('[::1]').id == 'default'
+        assert registry.resolve(None).id == 'default'
+    
+    def test_content_loaded_lazily(self, multi_app):
+        """Test that site content is only read on first request"""
+        site = multi_app.extensions['sites'].sites['ada']
+        assert not site.loaded
+        assert repr(site) == '<Site ada>'
+        multi_app.test_client().get('/', base_url='http://ada.example.com')
+        assert site.loaded
+        assert site.content_version
+    
+    def test_enforce_budget_evicts_inactive_sites(self, content_dir):
+        """Test that the least recently active site loses its pages first"""
+        registry = SiteRegistry.from_file(str(content_dir / 'sites.json'),
+                                          str(content_dir), 1024, 150)
+        default, ada = registry.sites['default'], registry.sites['ada']
+        registry.resolve('localhost')
+        default.page_cache.set('/', b'x' * 100)
+        registry.resolve('ada.example.com')
+        ada.page_cache.set('/', b'y' * 100)
+        registry.enforce_budget()
+        assert len(default.page_cache) == 0
+        assert len(ada.page_cache) == 1
+        assert registry.cache_bytes() == 100
+    
+    def test_reload_clears_pages_on_change(self, content_dir):
+        """Test that reloading changed content bumps the version"""
+        site = Site('ada', str(content_dir / 'ada.json'))
+        assert site.name == 'Ada Lovelace'
+        version = site.content_version
+        site.page_cache.set('/', b'page')
+        assert not site.reload()
+        assert len(site.page_cache) == 1
+        content = json.loads((content_dir / 'ada.json').read_text(encoding='utf-8'))
+        content['profile']['name'] = 'Countess Lovelace'
+        (content_dir / 'ada.json').write_text(json.dumps(content), encoding='utf-8')
+        assert site.reload()
+        assert site.content_version != version
+        assert site.name == 'Countess Lovelace'
+        assert len(site.page_cache) == 0
+
+
+    def test_content_changes_reach_every_site(self, content_dir):
+        """Test that polling reloads changed sites and notifies listeners"""
+        registry = SiteRegistry.from_file(str(content_dir / 'sites.json'), str(content_dir),
+                                          1024 * 1024, 1024 * 1024)
+        site = registry.sites['ada']
+        notified = []
+        registry.on_content_change(notified.append)
+        registry.on_content_change(lambda site: 1 / 0)
+        assert site.name == 'Ada Lovelace'
+        assert registry.check_for_changes() == []
+        path = content_dir / 'ada.json'
+        content = json.loads(path.read_text(encoding='utf-8'))
+        content['profile']['name'] = 'Countess Lovelace'
+        path.write_text(json.dumps(content), encoding='utf-8')
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        assert registry.check_for_changes() == ['ada']
+        assert notified == [site]
+        assert site.name == 'Countess Lovelace'
+        # Unloaded sites are left alone
+        assert not registry.sites['default'].loaded
+    
+    def test_poller_started_per_process(self, app, content_dir):
+        """Test that the first request starts the content poller"""
+        registry = SiteRegistry.from_file(str(content_dir / 'sites.json'), str(content_dir),
+                                          1024 * 1024, 1024 * 1024, poll_interval=0.01)
+        app.extensions['sites'] = registry
+        app.test_client().get('/contact/')
+        site = registry.default
+        version = site.content_version
+        path = content_dir / 'default.json'
+        content = json.loads(path.read_text(encoding='utf-8'))
+        content['profile']['name'] = 'Someone Else'
+        path.write_text(json.dumps(content), encoding='utf-8')
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        deadline = time.time() + 5
+        while site.content_version == version and time.time() < deadline:
+            time.sleep(0.01)
+        assert site.name == 'Someone Else'
+
+
+class TestSiteRendering:
+    """Test that routes render per-site content"""
+    
+    def test_pages_use_site_profile(self, multi_app):
+        """Test that each host gets its own owner details"""
+        client = multi_app.test_client()
+        ada = client.get('/business/', base_url='http://ada.example.com')
+        assert b'Business Professional | Ada Lovelace' in ada.data
+        default = client.get('/business/')
+        assert b'Business Professional | Joshua Nizamudin' in default.data
+    
+    def test_fragments_cached_per_site(self, multi_app):
+        """Test that shared components are not leaked across sites"""
+        client = multi_app.test_client()
+        client.get('/contact/')
+        response = client.get('/contact/', base_url='http://ada.example.com')
+        assert b'Ada Lovelace' in response.data
+        assert b'AL' in response.data
+    
+    def test_theme_override(self, multi_app):
+        """Test that a site's theme can override page templates"""
+        multi_app.jinja_env.loader = ChoiceLoader([
+            DictLoader({'themes/dark/pages/index.html': 'dark theme for {{ site.name }}'}),
+            multi_app.jinja_env.loader
+        ])
+        client = multi_app.test_client()
+        response = client.get('/', base_url='http://ada.example.com')
+        assert response.data == b'dark theme for Ada Lovelace'
+        assert b'<nav' in client.get('/').data
+    
+    def test_current_site_outside_request(self, app):
+        """Test that the default site is used without a request"""
+        with app.app_context():
+            assert current_site() is app.extensions['sites'].default
+
+
+class TestPageCache:
+    """Test per-site rendered page caching"""
+    
+    def test_page_served_from_cache(self, app, client):
+        """Test that a repeat request is answered from the page cache"""
+        site = app.extensions['sites'].default
+        first = client.get('/developer/')
+        second = client.get('/developer/')
+        assert first.data == second.data
+        assert site.page_cache.hits == 1
+    
+    def test_render_straddling_reload_not_served(self, multi_app, content_dir):
+        """Test that a page rendered before a reload is not served after it"""
+        from app.utils.sites import site_cached
+        site = multi_app.extensions['sites'].default
+        path = content_dir / 'default.json'
+        
+        @multi_app.route('/slow-name')
+        @site_cached()
+        def slow_name():
+            name = site.name
+            if name != 'Renamed':
+                # The content changes while this request is still rendering
+                content = json.loads(path.read_text(encoding='utf-8'))
+                content['profile']['name'] = 'Renamed'
+                path.write_text(json.dumps(content), encoding='utf-8')
+                site.reload()
+            return name
+        
+        client = multi_app.test_client()
+        assert client.get('/slow-name').data != b'Renamed'
+        assert client.get('/slow-name').data == b'Renamed'
+    
+    def test_snapshot_replaced_as_one(self, content_dir):
+        """Test that a reload swaps content, version and index together"""
+        site = Site('ada', str(content_dir / 'ada.json'))
+        before = site.snapshot
+        content = json.loads((content_dir / 'ada.json').read_text(encoding='utf-8'))
+        content['projects']['items'] = content['projects']['items'][:1]
+        (content_dir / 'ada.json').write_text(json.dumps(content), encoding='utf-8')
+        assert site.reload()
+        after = site.snapshot
+        assert before.version != after.version
+        assert len(before.projects_by_id) > 1
+        assert list(after.projects_by_id) == [after.content['projects']['items'][0]['id']]
+    
+    def test_vary_args_cached_separately(self, client):
+        """Test that declared query arguments are part of the key"""
+        client.get('/projects/?category=Backend')
+        response = client.get('/projects/?category=all')
+        assert b'AI Therapy Application' in response.data
+    
+    def test_pending_flashes_bypass_cache(self, app, client):
+        """Test that requests with flash messages are not cached"""
+        with client.session_transaction() as session:
+            session['_flashes'] = [('success', 'hello')]
+        client.get('/business/')
+        assert len(app.extensions['sites'].default.page_cache) == 0
+    
+    def test_cache_disabled_in_development(self):
+        """Test that development mode always re-renders"""
+        app = create_app('development')
+        app.test_client().get('/business/')
+        assert len(app.extensions['sites'].default.page_cache) == 0
@@ -0,0 +1,199 @@
+"""Tests for the static file middleware"""
+import os
+import pytest
+from werkzeug.http import http_date
+from werkzeug.test import Client
+from app.utils.static_files import StaticFilesMiddleware
+
+
+def fallback_app(environ, start_response):
+    """WSGI app standing in for the Flask application"""
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [b'dynamic']
+
+
+@pytest.fixture
+def static_root(tmp_path):
+    """Create a static directory with one small and one large file"""
+    (tmp_path / 'small.css').write_bytes(b'body { color: red; }')
+    (tmp_path / 'large.bin').write_bytes(bytes(range(256)) * 400)
+    return tmp_path
+
+
+@pytest.fixture
+def static_client(static_root):
+    """Client for a middleware with a 1 KB hot-file threshold"""
+    middleware = StaticFilesMiddleware(fallback_app, str(static_root),
+                                       hot_file_max_bytes=1024)
+    return Client(middleware)
+
+
+class TestStaticMiddleware:
+    """Test static file serving"""
+    
+    def test_non_static_passes_through(self, static_client):
+        """Test that other paths reach the wrapped application"""
+        response = static_client.get('/projects/')
+        assert response.data == b'dynamic'
+    
+    def test_small_file_served_from_memory(self, static_client, static_root):
+        """Test that small files are cached in the hot set"""
+        response = static_client.get('/static/small.css')
+        assert response.status_code == 200
+        assert response.data == b'body { color: red; }'
+        assert response.headers['Content-Type'] == 'text/css; charset=utf-8'
+        assert response.headers['Accept-Ranges'] == 'bytes'
+        assert 'max-age=3600' in response.headers['Cache-Control']
+        (static_root / 'small.css').unlink()
+        # Stat fails once the file is gone, so the hot copy is not served
+        assert static_client.get('/static/small.css').status_code == 404
+    
+    def test_hot_set_reused(self, static_root):
+        """Test that repeat requests hit the in-memory copy"""
+        middleware = StaticFilesMiddleware(fallback_app, str(static_root))
+        client = Client(middleware)
+        client.get('/static/small.css')
+        client.get('/static/small.css')
+        assert middleware.hot_cache.hits == 1
+    
+    def test_large_file_streamed(self, static_client):
+        """Test that large files are streamed in full"""
+        response = static_client.get('/static/large.bin')
+        assert response.status_code == 200
+        assert len(response.data) == 256 * 400
+        assert response.headers['Content-Length'] == str(256 * 400)
+    
+    def test_head_request(self, static_client):
+        """Test that HEAD returns headers without a body"""
+        response = static_client.head('/static/large.bin')
+        assert response.status_code == 200
+        assert response.data == b''
+        assert response.headers['Content-Length'] == str(256 * 400)
+    
+    def test_etag_not_modified(self, static_client):
+        """Test that a matching If-None-Match returns 304"""
+        etag = static_client.get('/static/small.css').headers['ETag']
+        assert not etag.startswith('W/')
+        response = static_client.get('/static/small.css',
+                                     headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+    
+    def test_if_modified_since(self, static_client, static_root):
+        """Test that If-Modified-Since returns 304 for unchanged files"""
+        mtime = os.stat(static_root / 'small.css').st_mtime
+        response = static_client.get('/static/small.css',
+                                     headers={'If-Modified-Since': http_date(mtime + 1)})
+        assert response.status_code == 304
+    
+    def test_range_small_file(self, static_client):
+        """Test a byte range served from memory"""
+        response = static_client.get('/static/small.css', headers={'Range': 'bytes=0-3'})
+        assert response.status_code == 206
+        assert response.data == b'body'
+        assert response.headers['Content-Range'] == 'bytes 0-3/20'
+    
+    def test_range_large_file(self, static_client):
+        """Test a byte range streamed from disk"""
+        response = static_client.get('/static/large.bin',
+                                     headers={'Range': 'bytes=256-259'})
+        assert response.status_code == 206
+        assert response.data == bytes([0, 1, 2, 3])
+        assert response.headers['Content-Length'] == '4'
+    
+    def test_suffix_range(self, static_client):
+        """Test a suffix byte range"""
+        response = static_client.get('/static/large.bin', headers={'Range': 'bytes=-2'})
+        assert response.status_code == 206
+        assert response.data == bytes([254, 255])
+    
+    def test_unsatisfiable_range(self, static_client):
+        """Test that out-of-bounds ranges return 416"""
+        response = static_client.get('/static/small.css',
+                                     headers={'Range': 'bytes=500-600'})
+        assert response.status_code == 416
+        assert response.headers['Content-Range'] == 'bytes */20'
+    
+    def test_multiple_ranges_send_full_file(self, static_client):
+        """Test that multi-range requests fall back to the full body"""
+        response = static_client.get('/static/small.css',
+                                     headers={'Range': 'bytes=0-1,4-5'})
+        assert response.status_code == 200
+        assert len(response.data) == 20
+    
+    def test_if_range_matching_etag(self, static_client):
+        """Test that If-Range with the current ETag honours the range"""
+        etag = static_client.get('/static/small.css').headers['ETag']
+        response = static_client.get('/static/small.css',
+                                     headers={'Range': 'bytes=0-3', 'If-Range': etag})
+        assert response.status_code == 206
+    
+    def test_if_range_stale_validator(self, static_client, static_root):
+        """Test that stale If-Range validators return the full file"""
+        for validator in ('"stale"', 'W/"weak"', http_date(0)):
+            response = static_client.get('/static/small.css',
+                                         headers={'Range': 'bytes=0-3',
+                                                  'If-Range': validator})
+            assert response.status_code == 200
+            assert len(response.data) == 20
+    
+    def test_if_range_matching_date(self, static_client, static_root):
+        """Test that If-Range with the Last-Modified date honours the range"""
+        mtime = os.stat(static_root / 'small.css').st_mtime
+        response = static_client.get('/static/small.css',
+                                     headers={'Range': 'bytes=0-3',
+                                              'If-Range': http_date(mtime)})
+        assert response.status_code == 206
+    
+    def test_missing_and_traversal(self, static_client):
+        """Test that missing files and path traversal return 404"""
+        assert static_client.get('/static/missing.css').status_code == 404
+        assert static_client.get('/static/../secret').status_code == 404
+        assert static_client.get('/static/').status_code == 404
+    
+    def test_method_not_allowed(self, static_client):
+        """Test that non-GET methods are rejected"""
+        response = static_client.post('/static/small.css')
+        assert response.status_code == 405
+        assert response.headers['Allow'] == 'GET, HEAD'
+    
+    def test_accel_redirect_for_large_files(self, static_root):
+        """Test that large files are offloaded to the proxy when configured"""
+        middleware = StaticFilesMiddleware(fallback_app, str(static_root),
+                                           hot_file_max_bytes=1024,
+                                           accel_prefix='/_static')
+        client = Client(middleware)
+        response = client.get('/static/large.bin')
+        assert response.status_code == 200
+        assert response.headers['X-Accel-Redirect'] == '/_static/large.bin'
+        assert response.data == b''
+        small = client.get('/static/small.css')
+        assert 'X-Accel-Redirect' not in small.headers
+
+
+class TestStaticIntegration:
+    """Test the middleware mounted on the Flask app"""
+    
+    def test_middleware_mounted(self, app):
+        """Test that create_app wraps the WSGI app"""
+        assert isinstance(app.wsgi_app, StaticFilesMiddleware)
+    
+    def test_static_css_served(self, client):
+        """Test that the stylesheet is served by the middleware"""
+        response = client.get('/static/css/main.css')
+        assert response.status_code == 200
+        assert 'ETag' in response.headers
+    
+    def test_large_image_range(self, client):
+        """Test a range request against the project screenshot"""
+        response = client.get('/static/images/Therapy_App.png',
+                              headers={'Range': 'bytes=0-7'})
+        assert response.status_code == 206
+        assert response.data == b'\x89PNG\r\n\x1a\n'
+    
+    def test_static_skips_blueprints(self, app, client):
+        """Test that static requests never reach Flask request handling"""
+        seen = []
+        app.before_request(lambda: seen.append(1))
+        client.get('/static/css/main.css')
+        assert not seen